@@ -4,7 +4,7 @@ from . import views
 app_name = 'admin_panel'
 
 urlpatterns = [
-    path('', views.AdminDashboardView.as_view(), name='dashboard'),
-    path('users/', views.UserManagementView.as_view(), name='users'),
-    path('settings/', views.SystemSettingsView.as_view(), name='settings'),
+    path('', views.AdminPanelView.as_view(page_title='Admin Panel - Dashboard'), name='dashboard'),
+    path('users/', views.AdminPanelView.as_view(page_title='Admin Panel - User Management'), name='users'),
+    path('settings/', views.AdminPanelView.as_view(page_title='Admin Panel - System Settings'), name='settings'),
 ]
\ No newline at end of file
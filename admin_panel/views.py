@@ -14,26 +14,12 @@ class AdminRequiredMixin(LoginRequiredMixin):
             raise PermissionDenied("Admin access required.")
         return super().dispatch(request, *args, **kwargs)
 
-class AdminDashboardView(AdminRequiredMixin, TemplateView):
+class AdminPanelView(AdminRequiredMixin, TemplateView):
+    """Admin panel placeholder page; page_title is supplied per route in urls.py"""
     template_name = 'base/placeholder.html'
+    page_title = ''
     
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context['page_title'] = 'Admin Panel - Dashboard'
-        return context
-
-class UserManagementView(AdminRequiredMixin, TemplateView):
-    template_name = 'base/placeholder.html'
-    
-    def get_context_data(self, **kwargs):
-        context = super().get_context_data(**kwargs)
-        context['page_title'] = 'Admin Panel - User Management'
-        return context
-
-class SystemSettingsView(AdminRequiredMixin, TemplateView):
-    template_name = 'base/placeholder.html'
-    
-    def get_context_data(self, **kwargs):
-        context = super().get_context_data(**kwargs)
-        context['page_title'] = 'Admin Panel - System Settings'
+        context['page_title'] = self.page_title
         return context
\ No newline at end of file
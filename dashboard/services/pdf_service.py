@@ -7,17 +7,12 @@ import os
 from datetime import datetime, timedelta
 from django.conf import settings
 from django.template.loader import render_to_string
+from django.utils import timezone
 from django.db.models import Count, Avg, Q, F
 from weasyprint import HTML, CSS
 from weasyprint.text.fonts import FontConfiguration
 
-from incidents.models import (
-    TransportNetworkIncident,
-    FileAccessNetworkIncident, 
-    RadioAccessNetworkIncident,
-    CoreNetworkIncident,
-    BackboneInternetNetworkIncident
-)
+from incidents.models import NETWORK_MODELS
 
 
 class PDFReportGenerator:
@@ -40,13 +35,7 @@ class PDFReportGenerator:
         self.user = user
         self.incidents_data = {}
         self.statistics = {}
-        self.network_models = {
-            'transport': TransportNetworkIncident,
-            'file_access': FileAccessNetworkIncident,
-            'radio_access': RadioAccessNetworkIncident,
-            'core': CoreNetworkIncident,
-            'backbone_internet': BackboneInternetNetworkIncident,
-        }
+        self.network_models = NETWORK_MODELS
         
     def filter_incidents_by_date(self):
         """
@@ -94,6 +83,7 @@ class PDFReportGenerator:
         }
         
         # Calculate totals across all networks
+        now = timezone.now()
         for network_type, data in self.incidents_data.items():
             stats['total_incidents'] += data['count']
             stats['total_active'] += data['active']
@@ -107,18 +97,18 @@ class PDFReportGenerator:
                 'name': self._get_network_display_name(network_type)
             }
             
-            # Severity breakdown
-            for incident in data['incidents']:
-                severity = incident.get_severity_display().lower()
-                if severity in stats['severity_breakdown']:
-                    stats['severity_breakdown'][severity] += 1
+            # Severity breakdown: one GROUP BY over the active incidents' severity buckets
+            model = self.network_models[network_type]
+            for severity, count in model.severity_counts(data['incidents'], now).items():
+                stats['severity_breakdown'][severity] += count
+            stats['severity_breakdown']['resolved'] += data['resolved']
             
-            # Causes and origins
-            for incident in data['incidents']:
-                if incident.cause:
-                    stats['top_causes'][incident.cause] = stats['top_causes'].get(incident.cause, 0) + 1
-                if incident.origin:
-                    stats['top_origins'][incident.origin] = stats['top_origins'].get(incident.origin, 0) + 1
+            # Causes and origins, counted in the database
+            for field, top_values in (('cause', stats['top_causes']), ('origin', stats['top_origins'])):
+                rows = data['incidents'].exclude(**{f'{field}__isnull': True}).exclude(**{field: ''}).order_by(
+                ).values(field).annotate(count=Count('pk'))
+                for row in rows:
+                    top_values[row[field]] = top_values.get(row[field], 0) + row['count']
         
         # Sort top causes and origins (get top 10)
         stats['top_causes'] = dict(sorted(stats['top_causes'].items(), key=lambda x: x[1], reverse=True)[:10])
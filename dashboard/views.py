@@ -11,24 +11,14 @@ import json
 
 from dashboard.services.pdf_service import PDFReportGenerator
 
-from incidents.models import (
-    TransportNetworkIncident, FileAccessNetworkIncident, 
-    RadioAccessNetworkIncident, CoreNetworkIncident, 
-    BackboneInternetNetworkIncident
-)
+from incidents.models import NETWORK_MODELS
 
 @login_required
 def dashboard_view(request):
     """Enhanced dashboard with real-time analytics and chart data"""
     try:
         # Define all network models for comprehensive statistics
-        network_models = {
-            'transport': TransportNetworkIncident,
-            'file_access': FileAccessNetworkIncident,
-            'radio_access': RadioAccessNetworkIncident,
-            'core': CoreNetworkIncident,
-            'backbone_internet': BackboneInternetNetworkIncident,
-        }
+        network_models = NETWORK_MODELS
         
         # Calculate overall statistics
         total_incidents = 0
@@ -60,18 +50,7 @@ def dashboard_view(request):
             
             # Calculate severity distribution for active incidents
             active_incidents_qs = model.objects.filter(date_time_recovery__isnull=True)
-            severity_counts = {'new': 0, 'low': 0, 'medium': 0, 'critical': 0}
-            
-            for incident in active_incidents_qs:
-                severity = incident.get_severity_class()
-                if severity == 'incident-new':
-                    severity_counts['new'] += 1
-                elif severity == 'incident-low':
-                    severity_counts['low'] += 1
-                elif severity == 'incident-medium':
-                    severity_counts['medium'] += 1
-                elif severity == 'incident-critical':
-                    severity_counts['critical'] += 1
+            severity_counts = model.severity_counts(active_incidents_qs, now)
             
             # Store network-specific stats
             network_stats[network_type] = {
@@ -276,9 +255,6 @@ def get_recent_incidents(network_models, limit=10):
 def get_chart_data_for_trends(network_models, days=7):
     """Get trend data for the last N days"""
     try:
-        from django.db.models import Count
-        from datetime import datetime, timedelta
-        
         end_date = timezone.now().date()
         start_date = end_date - timedelta(days=days-1)
         
@@ -358,14 +334,13 @@ def get_hourly_distribution_data(network_models, days=7):
         hourly_counts = defaultdict(int)
         
         for model in network_models.values():
-            incidents = model.objects.filter(
+            incident_times = model.objects.filter(
                 date_time_incident__gte=start_date,
                 date_time_incident__lte=end_date
-            )
+            ).values_list('date_time_incident', flat=True).iterator(chunk_size=2000)
             
-            for incident in incidents:
-                hour = incident.date_time_incident.hour
-                hourly_counts[hour] += 1
+            for incident_time in incident_times:
+                hourly_counts[incident_time.hour] += 1
         
         # Format for Chart.js
         hourly_data = []
@@ -461,15 +436,15 @@ def get_resolution_time_trends(network_models, days=30):
             resolved_count = 0
             
             for model in network_models.values():
-                incidents = model.objects.filter(
+                durations = model.objects.filter(
                     date_time_recovery__isnull=False,
                     date_time_recovery__gte=week_start_dt,
                     date_time_recovery__lte=week_end_dt
-                )
+                ).values_list('duration_minutes', flat=True).iterator(chunk_size=2000)
                 
-                for incident in incidents:
-                    if incident.duration_minutes:
-                        total_resolution_minutes += incident.duration_minutes
+                for duration_minutes in durations:
+                    if duration_minutes:
+                        total_resolution_minutes += duration_minutes
                         resolved_count += 1
             
             avg_hours = (total_resolution_minutes / resolved_count / 60) if resolved_count > 0 else 0
@@ -500,16 +475,14 @@ def get_peak_time_analysis(network_models, days=7):
         daily_counts = defaultdict(int)
         
         for model in network_models.values():
-            incidents = model.objects.filter(
+            incident_times = model.objects.filter(
                 date_time_incident__gte=start_date,
                 date_time_incident__lte=end_date
-            )
+            ).values_list('date_time_incident', flat=True).iterator(chunk_size=2000)
             
-            for incident in incidents:
-                hour = incident.date_time_incident.hour
-                day = incident.date_time_incident.strftime('%A')
-                hourly_counts[hour] += 1
-                daily_counts[day] += 1
+            for incident_time in incident_times:
+                hourly_counts[incident_time.hour] += 1
+                daily_counts[incident_time.strftime('%A')] += 1
         
         # Find peaks
         peak_hour = max(hourly_counts.items(), key=lambda x: x[1]) if hourly_counts else (0, 0)
@@ -612,13 +585,12 @@ def get_resolution_time_distribution(network_models):
         bucket_counts = defaultdict(int)
         
         for model in network_models.values():
-            incidents = model.objects.filter(
+            durations = model.objects.filter(
                 date_time_recovery__isnull=False,
                 duration_minutes__isnull=False
-            )
+            ).values_list('duration_minutes', flat=True).iterator(chunk_size=2000)
             
-            for incident in incidents:
-                duration = incident.duration_minutes
+            for duration in durations:
                 for bucket_name, (min_val, max_val) in buckets.items():
                     if min_val <= duration < max_val:
                         bucket_counts[bucket_name] += 1
@@ -651,14 +623,13 @@ def get_day_of_week_distribution(network_models, days=30):
         day_order = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
         
         for model in network_models.values():
-            incidents = model.objects.filter(
+            incident_times = model.objects.filter(
                 date_time_incident__gte=start_date,
                 date_time_incident__lte=end_date
-            )
+            ).values_list('date_time_incident', flat=True).iterator(chunk_size=2000)
             
-            for incident in incidents:
-                day_name = incident.date_time_incident.strftime('%A')
-                day_counts[day_name] += 1
+            for incident_time in incident_times:
+                day_counts[incident_time.strftime('%A')] += 1
         
         return {
             'labels': day_order,
@@ -729,13 +700,7 @@ def refresh_chart_data(request):
     """AJAX endpoint to refresh chart data without page reload"""
     try:
         # Define network models
-        network_models = {
-            'transport': TransportNetworkIncident,
-            'file_access': FileAccessNetworkIncident,
-            'radio_access': RadioAccessNetworkIncident,
-            'core': CoreNetworkIncident,
-            'backbone_internet': BackboneInternetNetworkIncident,
-        }
+        network_models = NETWORK_MODELS
         
         # Get refresh parameters from request
         period = request.GET.get('period', '7')  # 7 or 30 days
@@ -762,23 +727,12 @@ def refresh_chart_data(request):
         network_stats = {}
         for network_type, model in network_models.items():
             active_incidents_qs = model.objects.filter(date_time_recovery__isnull=True)
-            severity_counts = {'new': 0, 'low': 0, 'medium': 0, 'critical': 0}
-            
-            for incident in active_incidents_qs:
-                severity = incident.get_severity_class()
-                if severity == 'incident-new':
-                    severity_counts['new'] += 1
-                elif severity == 'incident-low':
-                    severity_counts['low'] += 1
-                elif severity == 'incident-medium':
-                    severity_counts['medium'] += 1
-                elif severity == 'incident-critical':
-                    severity_counts['critical'] += 1
+            severity_counts = model.severity_counts(active_incidents_qs, now)
             
             network_stats[network_type] = {
                 'name': get_network_display_name(network_type),
                 'total': model.objects.count(),
-                'active': active_incidents_qs.count(),
+                'active': sum(severity_counts.values()),
                 'severity_counts': severity_counts,
             }
         
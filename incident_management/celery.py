@@ -29,6 +29,10 @@ app.conf.beat_schedule = {
         # 'schedule': crontab(minute='*/5'),  # Every 5 minutes
         # 'schedule': 60.0,  # Every 60 seconds
     },
+    'refresh-severity-stats-every-minute': {
+        'task': 'incidents.tasks.refresh_list_statistics',
+        'schedule': 60.0,  # Re-warms before the 90s cached list statistics expire
+    },
 }
 
 app.conf.timezone = 'UTC'
@@ -203,6 +203,29 @@ X_FRAME_OPTIONS = 'DENY'
 # Custom User Model
 AUTH_USER_MODEL = 'authentication.CustomUser'
 
+# ============================================
+# CACHE CONFIGURATION
+# ============================================
+
+# Set CACHE_URL (e.g. redis://localhost:6379/1) to share one Redis cache between
+# web processes and Celery workers, so warmed statistics and invalidations are
+# visible everywhere; without it each process keeps its own local-memory cache
+CACHE_URL = config('CACHE_URL', default='')
+
+if CACHE_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': CACHE_URL,
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
+    }
+
 # ============================================
 # CELERY CONFIGURATION
 # ============================================
@@ -7,15 +7,27 @@ from .models import (
     BackboneInternetNetworkIncident, DropdownConfiguration
 )
 from .validators import IncidentValidators, DuplicateIncidentChecker
+from .utils import get_dropdown_choices_many
 import ipaddress
 from datetime import timedelta
 
 class BaseIncidentForm(forms.ModelForm):
     """Base form with common validation for all incident types"""
     
+    # DropdownConfiguration categories this form reads, loaded together in __init__
+    dropdown_categories = ('cause', 'origin')
+    
+    # Form field -> DuplicateIncidentChecker.check_all argument probed for new incidents
+    duplicate_check_fields = {}
+    
     def __init__(self, *args, **kwargs):
         self.user = kwargs.pop('user', None)
         super().__init__(*args, **kwargs)
+        try:
+            self.dropdowns = get_dropdown_choices_many(self.dropdown_categories)
+        except Exception:
+            # Database not available: the populate methods fall back to empty choices
+            self.dropdowns = {}
         
         # Enhanced datetime widgets with 24-hour format enforcement
         if 'date_time_incident' in self.fields:
@@ -49,22 +61,16 @@ class BaseIncidentForm(forms.ModelForm):
     def _populate_dropdown_choices(self):
         """Populate dropdown choices from database"""
         try:
-            from .models import DropdownConfiguration
-            
             # Populate common choices
             if 'cause' in self.fields:
                 cause_choices = [('', '--- Select Cause ---')]
-                causes = DropdownConfiguration.objects.filter(
-                    category='cause', is_active=True
-                ).order_by('sort_order', 'value')
+                causes = self.dropdowns['cause']
                 cause_choices.extend([(c.value, c.value) for c in causes])
                 self.fields['cause'].choices = cause_choices
             
             if 'origin' in self.fields:
                 origin_choices = [('', '--- Select Origin ---')]
-                origins = DropdownConfiguration.objects.filter(
-                    category='origin', is_active=True
-                ).order_by('sort_order', 'value')
+                origins = self.dropdowns['origin']
                 origin_choices.extend([(o.value, o.value) for o in origins])
                 self.fields['origin'].choices = origin_choices
                 
@@ -127,6 +133,17 @@ class BaseIncidentForm(forms.ModelForm):
                     "Recovery time cannot be more than 30 days after incident time"
                 )
         
+        # Check for duplicates (only for new incidents): every probe in one query
+        if not self.instance.pk and incident_time and self.duplicate_check_fields:
+            DuplicateIncidentChecker.check_all(
+                self._meta.model,
+                incident_time=incident_time,
+                **{
+                    argument: cleaned_data.get(field)
+                    for field, argument in self.duplicate_check_fields.items()
+                }
+            )
+        
         return cleaned_data
     
     def save(self, commit=True):
@@ -144,6 +161,11 @@ class BaseIncidentForm(forms.ModelForm):
 class TransportNetworkIncidentForm(BaseIncidentForm):
     """Form for Transport Network Incidents with advanced validation"""
     
+    # DropdownConfiguration categories this form reads, loaded together in __init__
+    dropdown_categories = BaseIncidentForm.dropdown_categories + ('region_loop', 'system_capacity', 'dot_states')
+    
+    duplicate_check_fields = {'extremity_a': 'extremity_a', 'extremity_b': 'extremity_b'}
+    
     class Meta:
         model = TransportNetworkIncident
         fields = [
@@ -171,29 +193,21 @@ class TransportNetworkIncidentForm(BaseIncidentForm):
     def _populate_transport_choices(self):
         """Populate transport-specific choices"""
         try:
-            from .models import DropdownConfiguration
-            
             if 'region_loop' in self.fields:
                 choices = [('', '--- Select Region/Loop ---')]
-                configs = DropdownConfiguration.objects.filter(
-                    category='region_loop', is_active=True
-                ).order_by('sort_order', 'value')
+                configs = self.dropdowns['region_loop']
                 choices.extend([(c.value, c.value) for c in configs])
                 self.fields['region_loop'].choices = choices
             
             if 'system_capacity' in self.fields:
                 choices = [('', '--- Select System/Capacity ---')]
-                configs = DropdownConfiguration.objects.filter(
-                    category='system_capacity', is_active=True
-                ).order_by('sort_order', 'value')
+                configs = self.dropdowns['system_capacity']
                 choices.extend([(c.value, c.value) for c in configs])
                 self.fields['system_capacity'].choices = choices
             
             if 'dot_extremity_a' in self.fields:
                 choices = [('', '--- Select DOT State ---')]
-                configs = DropdownConfiguration.objects.filter(
-                    category='dot_states', is_active=True
-                ).order_by('sort_order', 'value')
+                configs = self.dropdowns['dot_states']
                 choices.extend([(c.value, c.value) for c in configs])
                 self.fields['dot_extremity_a'].choices = choices
                 self.fields['dot_extremity_b'].choices = choices
@@ -216,7 +230,6 @@ class TransportNetworkIncidentForm(BaseIncidentForm):
         extremity_b = cleaned_data.get('extremity_b')
         dot_extremity_a = cleaned_data.get('dot_extremity_a')
         dot_extremity_b = cleaned_data.get('dot_extremity_b')
-        incident_time = cleaned_data.get('date_time_incident')
         
         # Validate extremity consistency
         if extremity_a and not dot_extremity_a:
@@ -228,20 +241,6 @@ class TransportNetworkIncidentForm(BaseIncidentForm):
         if extremity_a and extremity_b and extremity_a.strip().lower() == extremity_b.strip().lower():
             raise forms.ValidationError("Extremity A and Extremity B cannot be the same location")
         
-        # Check for duplicates (only for new incidents)
-        if not self.instance.pk and extremity_a and extremity_b and incident_time:
-            existing = TransportNetworkIncident.objects.filter(
-                extremity_a__iexact=extremity_a,
-                extremity_b__iexact=extremity_b,
-                date_time_incident__gte=incident_time - timedelta(hours=1),
-                date_time_incident__lte=incident_time + timedelta(hours=1),
-                date_time_recovery__isnull=True
-            )
-            if existing.exists():
-                raise forms.ValidationError(
-                    f"A similar incident for {extremity_a} to {extremity_b} already exists within the last hour"
-                )
-        
         return cleaned_data
     
     def __init__(self, *args, **kwargs):
@@ -251,29 +250,21 @@ class TransportNetworkIncidentForm(BaseIncidentForm):
     def _populate_transport_choices(self):
         """Populate transport-specific choices"""
         try:
-            from .models import DropdownConfiguration
-            
             if 'region_loop' in self.fields:
                 choices = [('', '--- Select Region/Loop ---')]
-                configs = DropdownConfiguration.objects.filter(
-                    category='region_loop', is_active=True
-                ).order_by('sort_order', 'value')
+                configs = self.dropdowns['region_loop']
                 choices.extend([(c.value, c.value) for c in configs])
                 self.fields['region_loop'].choices = choices
             
             if 'system_capacity' in self.fields:
                 choices = [('', '--- Select System/Capacity ---')]
-                configs = DropdownConfiguration.objects.filter(
-                    category='system_capacity', is_active=True
-                ).order_by('sort_order', 'value')
+                configs = self.dropdowns['system_capacity']
                 choices.extend([(c.value, c.value) for c in configs])
                 self.fields['system_capacity'].choices = choices
             
             if 'dot_extremity_a' in self.fields:
                 choices = [('', '--- Select DOT State ---')]
-                configs = DropdownConfiguration.objects.filter(
-                    category='dot_states', is_active=True
-                ).order_by('sort_order', 'value')
+                configs = self.dropdowns['dot_states']
                 choices.extend([(c.value, c.value) for c in configs])
                 self.fields['dot_extremity_a'].choices = choices
                 self.fields['dot_extremity_b'].choices = choices
@@ -413,86 +404,40 @@ def get_incident_form_class(network_type):
     }
     return form_classes.get(network_type)
 
+# (form field, DropdownConfiguration category, empty label) refreshed by update_form_common_fields
+COMMON_FIELD_CHOICES = (
+    ('cause', 'cause', '--- Select Cause ---'),
+    ('origin', 'origin', '--- Select Origin ---'),
+)
+
+NETWORK_FIELD_CHOICES = {
+    'transport': (
+        ('region_loop', 'region_loop', '--- Select Region/Loop ---'),
+        ('system_capacity', 'system_capacity', '--- Select System/Capacity ---'),
+        ('dot_extremity_a', 'dot_states', '--- Select DOT State ---'),
+        ('dot_extremity_b', 'dot_states', '--- Select DOT State ---'),
+    ),
+}
+
 def update_form_common_fields(form, network_type):
     """Update form fields with dropdown choices from DropdownConfiguration"""
     try:
-        # Import here to avoid circular imports
-        from .models import DropdownConfiguration
-        
-        # Debug: Check if we have data
-        total_configs = DropdownConfiguration.objects.count()
-        print(f"DEBUG: Total dropdown configurations: {total_configs}")
-        
-        # Update cause choices
-        if 'cause' in form.fields:
-            cause_choices = [('', '--- Select Cause ---')]
-            cause_configs = DropdownConfiguration.objects.filter(
-                category='cause', 
-                is_active=True
-            ).order_by('sort_order', 'value')
-            
-            for config in cause_configs:
-                cause_choices.append((config.value, config.value))
-            
-            form.fields['cause'].choices = cause_choices
-            print(f"DEBUG: Cause choices set: {len(cause_choices)} options")
+        fields = [
+            entry for entry in (*COMMON_FIELD_CHOICES, *NETWORK_FIELD_CHOICES.get(network_type, ()))
+            if entry[0] in form.fields
+        ]
         
-        # Update origin choices  
-        if 'origin' in form.fields:
-            origin_choices = [('', '--- Select Origin ---')]
-            origin_configs = DropdownConfiguration.objects.filter(
-                category='origin', 
-                is_active=True
-            ).order_by('sort_order', 'value')
-            
-            for config in origin_configs:
-                origin_choices.append((config.value, config.value))
-            
-            form.fields['origin'].choices = origin_choices
-            print(f"DEBUG: Origin choices set: {len(origin_choices)} options")
+        # Reuse the options the form loaded in __init__; any other category is
+        # fetched together with the rest in one lookup
+        dropdowns = getattr(form, 'dropdowns', None) or {}
+        missing = [category for _, category, _ in fields if category not in dropdowns]
+        if missing:
+            dropdowns = {**dropdowns, **get_dropdown_choices_many(missing)}
         
-        # Network-specific dropdown updates
-        if network_type == 'transport':
-            if 'region_loop' in form.fields:
-                region_choices = [('', '--- Select Region/Loop ---')]
-                region_configs = DropdownConfiguration.objects.filter(
-                    category='region_loop', 
-                    is_active=True
-                ).order_by('sort_order', 'value')
-                
-                for config in region_configs:
-                    region_choices.append((config.value, config.value))
-                
-                form.fields['region_loop'].choices = region_choices
-                print(f"DEBUG: Region choices set: {len(region_choices)} options")
-            
-            if 'system_capacity' in form.fields:
-                system_choices = [('', '--- Select System/Capacity ---')]
-                system_configs = DropdownConfiguration.objects.filter(
-                    category='system_capacity', 
-                    is_active=True
-                ).order_by('sort_order', 'value')
-                
-                for config in system_configs:
-                    system_choices.append((config.value, config.value))
-                
-                form.fields['system_capacity'].choices = system_choices
-                print(f"DEBUG: System choices set: {len(system_choices)} options")
-            
-            # DOT extremity choices
-            if 'dot_extremity_a' in form.fields:
-                dot_choices = [('', '--- Select DOT State ---')]
-                dot_configs = DropdownConfiguration.objects.filter(
-                    category='dot_states', 
-                    is_active=True
-                ).order_by('sort_order', 'value')
-                
-                for config in dot_configs:
-                    dot_choices.append((config.value, config.value))
-                
-                form.fields['dot_extremity_a'].choices = dot_choices
-                form.fields['dot_extremity_b'].choices = dot_choices
-                print(f"DEBUG: DOT choices set: {len(dot_choices)} options")
+        for field_name, category, empty_label in fields:
+            form.fields[field_name].choices = [('', empty_label)] + [
+                (config.value, config.value) for config in dropdowns[category]
+            ]
     
     except Exception as e:
         print(f"ERROR in update_form_common_fields: {e}")
@@ -593,6 +538,9 @@ def populate_sample_dropdown_data():
 class BaseSearchForm(forms.Form):
     """Base search form with common search fields for all networks"""
     
+    # DropdownConfiguration categories this form reads, loaded together in __init__
+    dropdown_categories = ('cause', 'origin')
+    
     # Text search field
     search_query = forms.CharField(
         max_length=200,
@@ -684,6 +632,11 @@ class BaseSearchForm(forms.Form):
     
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
+        try:
+            self.dropdowns = get_dropdown_choices_many(self.dropdown_categories)
+        except Exception:
+            # Database not available: the populate methods fall back to empty choices
+            self.dropdowns = {}
         self._populate_base_choices()
     
     def _populate_base_choices(self):
@@ -691,17 +644,13 @@ class BaseSearchForm(forms.Form):
         try:
             # Populate cause choices using your existing system
             cause_choices = [('', 'All Causes')]
-            cause_configs = DropdownConfiguration.objects.filter(
-                category='cause', is_active=True
-            ).order_by('sort_order', 'value')
+            cause_configs = self.dropdowns['cause']
             cause_choices.extend([(c.value, c.value) for c in cause_configs])
             self.fields['cause'].choices = cause_choices
             
             # Populate origin choices using your existing system
             origin_choices = [('', 'All Origins')]
-            origin_configs = DropdownConfiguration.objects.filter(
-                category='origin', is_active=True
-            ).order_by('sort_order', 'value')
+            origin_configs = self.dropdowns['origin']
             origin_choices.extend([(o.value, o.value) for o in origin_configs])
             self.fields['origin'].choices = origin_choices
             
@@ -713,6 +662,9 @@ class BaseSearchForm(forms.Form):
 class TransportNetworkSearchForm(BaseSearchForm):
     """Search form specific to Transport Networks"""
     
+    # DropdownConfiguration categories this form reads, loaded together in __init__
+    dropdown_categories = BaseSearchForm.dropdown_categories + ('region_loop', 'system_capacity')
+    
     region_loop = forms.ChoiceField(
         required=False,
         widget=forms.Select(attrs={
@@ -756,17 +708,13 @@ class TransportNetworkSearchForm(BaseSearchForm):
         try:
             # Region/Loop choices
             region_choices = [('', 'All Regions')]
-            region_configs = DropdownConfiguration.objects.filter(
-                category='region_loop', is_active=True
-            ).order_by('sort_order', 'value')
+            region_configs = self.dropdowns['region_loop']
             region_choices.extend([(c.value, c.value) for c in region_configs])
             self.fields['region_loop'].choices = region_choices
             
             # System/Capacity choices
             system_choices = [('', 'All Systems')]
-            system_configs = DropdownConfiguration.objects.filter(
-                category='system_capacity', is_active=True
-            ).order_by('sort_order', 'value')
+            system_configs = self.dropdowns['system_capacity']
             system_choices.extend([(c.value, c.value) for c in system_configs])
             self.fields['system_capacity'].choices = system_choices
             
@@ -778,6 +726,9 @@ class TransportNetworkSearchForm(BaseSearchForm):
 class FileAccessNetworkSearchForm(BaseSearchForm):
     """Search form specific to File Access Networks"""
     
+    # DropdownConfiguration categories this form reads, loaded together in __init__
+    dropdown_categories = BaseSearchForm.dropdown_categories + ('wilayas',)
+    
     do_wilaya = forms.ChoiceField(
         required=False,
         widget=forms.Select(attrs={
@@ -822,9 +773,7 @@ class FileAccessNetworkSearchForm(BaseSearchForm):
         try:
             # Wilaya choices using your existing category name
             wilaya_choices = [('', 'All Wilayas')]
-            wilaya_configs = DropdownConfiguration.objects.filter(
-                category='wilayas', is_active=True
-            ).order_by('sort_order', 'value')
+            wilaya_configs = self.dropdowns['wilayas']
             wilaya_choices.extend([(c.value, c.value) for c in wilaya_configs])
             self.fields['do_wilaya'].choices = wilaya_choices
             
@@ -834,6 +783,9 @@ class FileAccessNetworkSearchForm(BaseSearchForm):
 class RadioAccessNetworkSearchForm(BaseSearchForm):
     """Search form specific to Radio Access Networks"""
     
+    # DropdownConfiguration categories this form reads, loaded together in __init__
+    dropdown_categories = BaseSearchForm.dropdown_categories + ('wilayas',)
+    
     do_wilaya = forms.ChoiceField(
         required=False,
         widget=forms.Select(attrs={
@@ -869,9 +821,7 @@ class RadioAccessNetworkSearchForm(BaseSearchForm):
         try:
             # Wilaya choices
             wilaya_choices = [('', 'All Wilayas')]
-            wilaya_configs = DropdownConfiguration.objects.filter(
-                category='wilayas', is_active=True
-            ).order_by('sort_order', 'value')
+            wilaya_configs = self.dropdowns['wilayas']
             wilaya_choices.extend([(c.value, c.value) for c in wilaya_configs])
             self.fields['do_wilaya'].choices = wilaya_choices
             
@@ -881,6 +831,9 @@ class RadioAccessNetworkSearchForm(BaseSearchForm):
 class CoreNetworkSearchForm(BaseSearchForm):
     """Search form specific to Core Networks"""
     
+    # DropdownConfiguration categories this form reads, loaded together in __init__
+    dropdown_categories = BaseSearchForm.dropdown_categories + ('platforms', 'region_nodes')
+    
     platform = forms.ChoiceField(
         required=False,
         widget=forms.Select(attrs={
@@ -915,17 +868,13 @@ class CoreNetworkSearchForm(BaseSearchForm):
         try:
             # Platform choices
             platform_choices = [('', 'All Platforms')]
-            platform_configs = DropdownConfiguration.objects.filter(
-                category='platforms', is_active=True
-            ).order_by('sort_order', 'value')
+            platform_configs = self.dropdowns['platforms']
             platform_choices.extend([(c.value, c.value) for c in platform_configs])
             self.fields['platform'].choices = platform_choices
             
             # Region/Node choices
             region_node_choices = [('', 'All Regions/Nodes')]
-            region_node_configs = DropdownConfiguration.objects.filter(
-                category='region_nodes', is_active=True
-            ).order_by('sort_order', 'value')
+            region_node_configs = self.dropdowns['region_nodes']
             region_node_choices.extend([(c.value, c.value) for c in region_node_configs])
             self.fields['region_node'].choices = region_node_choices
             
@@ -936,6 +885,9 @@ class CoreNetworkSearchForm(BaseSearchForm):
 class BackboneInternetNetworkSearchForm(BaseSearchForm):
     """Search form specific to Backbone Internet Networks"""
     
+    # DropdownConfiguration categories this form reads, loaded together in __init__
+    dropdown_categories = BaseSearchForm.dropdown_categories + ('interconnect_types', 'platform_igws')
+    
     interconnect_type = forms.ChoiceField(
         required=False,
         widget=forms.Select(attrs={
@@ -970,17 +922,13 @@ class BackboneInternetNetworkSearchForm(BaseSearchForm):
         try:
             # Interconnect type choices
             interconnect_choices = [('', 'All Types')]
-            interconnect_configs = DropdownConfiguration.objects.filter(
-                category='interconnect_types', is_active=True
-            ).order_by('sort_order', 'value')
+            interconnect_configs = self.dropdowns['interconnect_types']
             interconnect_choices.extend([(c.value, c.value) for c in interconnect_configs])
             self.fields['interconnect_type'].choices = interconnect_choices
             
             # Platform IGW choices
             platform_igw_choices = [('', 'All Platforms/IGWs')]
-            platform_igw_configs = DropdownConfiguration.objects.filter(
-                category='platform_igws', is_active=True
-            ).order_by('sort_order', 'value')
+            platform_igw_configs = self.dropdowns['platform_igws']
             platform_igw_choices.extend([(c.value, c.value) for c in platform_igw_configs])
             self.fields['platform_igw'].choices = platform_igw_choices
             
@@ -0,0 +1,37 @@
+# Generated by Django 4.2.25 on 2026-10-16 09:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('incidents', '0004_savedsearch'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='transportnetworkincident',
+            index=models.Index(fields=['extremity_a', 'extremity_b', 'date_time_incident', 'date_time_recovery'], name='transport_dup_extremity_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='fileaccessnetworkincident',
+            index=models.Index(fields=['ip_address', 'date_time_incident', 'date_time_recovery'], name='fileaccess_dup_ip_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='fileaccessnetworkincident',
+            index=models.Index(fields=['site', 'date_time_incident', 'date_time_recovery'], name='fileaccess_dup_site_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='radioaccessnetworkincident',
+            index=models.Index(fields=['ip_address', 'date_time_incident', 'date_time_recovery'], name='radioaccess_dup_ip_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='radioaccessnetworkincident',
+            index=models.Index(fields=['site', 'date_time_incident', 'date_time_recovery'], name='radioaccess_dup_site_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='corenetworkincident',
+            index=models.Index(fields=['site', 'date_time_incident', 'date_time_recovery'], name='core_dup_site_idx'),
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 4.2.25 on 2026-10-16 09:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('incidents', '0005_duplicate_check_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='transportnetworkincident',
+            index=models.Index(fields=['date_time_recovery', 'date_time_incident'], name='transport_active_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='fileaccessnetworkincident',
+            index=models.Index(fields=['date_time_recovery', 'date_time_incident'], name='fileaccess_active_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='radioaccessnetworkincident',
+            index=models.Index(fields=['date_time_recovery', 'date_time_incident'], name='radioaccess_active_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='corenetworkincident',
+            index=models.Index(fields=['date_time_recovery', 'date_time_incident'], name='core_active_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='backboneinternetnetworkincident',
+            index=models.Index(fields=['date_time_recovery', 'date_time_incident'], name='backbone_active_idx'),
+        ),
+    ]
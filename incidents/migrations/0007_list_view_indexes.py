@@ -0,0 +1,53 @@
+# Generated by Django 4.2.25 on 2026-10-16 09:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('incidents', '0006_active_incident_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='transportnetworkincident',
+            index=models.Index(fields=['is_archived', '-date_time_incident'], name='transport_list_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='transportnetworkincident',
+            index=models.Index(fields=['-date_time_recovery'], name='transport_recovered_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='fileaccessnetworkincident',
+            index=models.Index(fields=['is_archived', '-date_time_incident'], name='fileaccess_list_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='fileaccessnetworkincident',
+            index=models.Index(fields=['-date_time_recovery'], name='fileaccess_recovered_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='radioaccessnetworkincident',
+            index=models.Index(fields=['is_archived', '-date_time_incident'], name='radioaccess_list_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='radioaccessnetworkincident',
+            index=models.Index(fields=['-date_time_recovery'], name='radioaccess_recovered_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='corenetworkincident',
+            index=models.Index(fields=['is_archived', '-date_time_incident'], name='core_list_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='corenetworkincident',
+            index=models.Index(fields=['-date_time_recovery'], name='core_recovered_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='backboneinternetnetworkincident',
+            index=models.Index(fields=['is_archived', '-date_time_incident'], name='backbone_list_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='backboneinternetnetworkincident',
+            index=models.Index(fields=['-date_time_recovery'], name='backbone_recovered_idx'),
+        ),
+    ]
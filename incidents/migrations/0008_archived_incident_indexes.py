@@ -0,0 +1,33 @@
+# Generated by Django 4.2.25 on 2026-10-16 09:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('incidents', '0007_list_view_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='transportnetworkincident',
+            index=models.Index(fields=['is_archived', '-archived_at'], name='transport_archived_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='fileaccessnetworkincident',
+            index=models.Index(fields=['is_archived', '-archived_at'], name='fileaccess_archived_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='radioaccessnetworkincident',
+            index=models.Index(fields=['is_archived', '-archived_at'], name='radioaccess_archived_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='corenetworkincident',
+            index=models.Index(fields=['is_archived', '-archived_at'], name='core_archived_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='backboneinternetnetworkincident',
+            index=models.Index(fields=['is_archived', '-archived_at'], name='backbone_archived_idx'),
+        ),
+    ]
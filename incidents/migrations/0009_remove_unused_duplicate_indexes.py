@@ -0,0 +1,33 @@
+# Generated by Django 4.2.25 on 2026-10-16 09:00
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('incidents', '0008_archived_incident_indexes'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='fileaccessnetworkincident',
+            name='fileaccess_dup_ip_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='fileaccessnetworkincident',
+            name='fileaccess_dup_site_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='radioaccessnetworkincident',
+            name='radioaccess_dup_ip_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='radioaccessnetworkincident',
+            name='radioaccess_dup_site_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='corenetworkincident',
+            name='core_dup_site_idx',
+        ),
+    ]
@@ -7,6 +7,16 @@ from django.core.exceptions import ValidationError
 from django.utils import timezone
 from datetime import timedelta
 
+# Time after recovery before a resolved incident can be archived
+ARCHIVE_DELAY = timedelta(hours=2)
+
+class IncidentQuerySet(models.QuerySet):
+    """QuerySet shared by all incident models"""
+    
+    def with_users(self):
+        """Join the creator and last updater, for pages that display them"""
+        return self.select_related('created_by', 'updated_by')
+
 class BaseIncident(models.Model):
     """
     Base model for all incident types with common fields
@@ -109,6 +119,10 @@ class BaseIncident(models.Model):
         help_text="Note explaining why correction is needed (for admin review)"
     )
     
+    # Users are joined on demand (with_users()) rather than by default: list
+    # queries narrow their columns with only(), which can't traverse deferred FKs
+    objects = IncidentQuerySet.as_manager()
+    
     class Meta:
         abstract = True
         indexes = [
@@ -177,6 +191,11 @@ class BaseIncident(models.Model):
     
     def get_severity_class(self):
         """Return CSS class based on incident age for color coding"""
+        # Rows loaded through with_severity() already carry the level computed in SQL
+        severity = getattr(self, 'severity', None)
+        if severity:
+            return f'incident-{severity}'
+        
         if self.is_resolved:
             return 'incident-resolved'
         
@@ -196,6 +215,60 @@ class BaseIncident(models.Model):
         else:
             return 'incident-critical' # Red background
     
+    @classmethod
+    def severity_case(cls, now=None):
+        """
+        SQL equivalent of get_severity_class() without the 'incident-' prefix,
+        for annotating querysets: resolved, new, low, medium or critical
+        """
+        now = now or timezone.now()
+        return models.Case(
+            models.When(is_resolved=True, then=models.Value('resolved')),
+            models.When(date_time_incident__isnull=True, then=models.Value('new')),
+            models.When(date_time_incident__gt=now - timedelta(hours=1), then=models.Value('new')),
+            models.When(date_time_incident__gt=now - timedelta(hours=2), then=models.Value('low')),
+            models.When(date_time_incident__gt=now - timedelta(hours=4), then=models.Value('medium')),
+            default=models.Value('critical'),
+            output_field=models.CharField(),
+        )
+    
+    @classmethod
+    def with_severity(cls, queryset, now=None):
+        """
+        Annotate a queryset with its rows' severity level (see severity_case), which
+        get_severity_class() then returns without recomputing the incident age
+        """
+        return queryset.annotate(severity=cls.severity_case(now))
+    
+    @classmethod
+    def severity_filters(cls, now=None):
+        """
+        Q filter per severity bucket of active incidents (same thresholds as
+        get_severity_class()), for conditional Count() aggregates
+        """
+        now = now or timezone.now()
+        one_hour_ago = now - timedelta(hours=1)
+        two_hours_ago = now - timedelta(hours=2)
+        four_hours_ago = now - timedelta(hours=4)
+        return {
+            'new': models.Q(date_time_incident__gt=one_hour_ago) | models.Q(date_time_incident__isnull=True),
+            'low': models.Q(date_time_incident__gt=two_hours_ago, date_time_incident__lte=one_hour_ago),
+            'medium': models.Q(date_time_incident__gt=four_hours_ago, date_time_incident__lte=two_hours_ago),
+            'critical': models.Q(date_time_incident__lte=four_hours_ago),
+        }
+    
+    @classmethod
+    def severity_counts(cls, queryset, now=None):
+        """Count a queryset's incidents per severity with a single GROUP BY query"""
+        counts = {'new': 0, 'low': 0, 'medium': 0, 'critical': 0}
+        rows = queryset.annotate(severity=cls.severity_case(now)).values('severity').annotate(
+            n=models.Count('pk')
+        ).order_by()
+        for row in rows:
+            if row['severity'] in counts:
+                counts[row['severity']] = row['n']
+        return counts
+    
     def get_severity_display(self):
         """Return human-readable severity level"""
         if self.is_resolved:
@@ -237,7 +310,7 @@ class BaseIncident(models.Model):
         if (self.date_time_recovery and 
             self.cause and self.cause.strip() and
             self.origin and self.origin.strip()):
-            archive_time = self.date_time_recovery + timedelta(hours=2)
+            archive_time = self.date_time_recovery + ARCHIVE_DELAY
             return timezone.now() >= archive_time
         
         return False
@@ -274,7 +347,7 @@ class BaseIncident(models.Model):
         
         # Check if 2 hours have passed since resolution
         time_since_resolution = timezone.now() - self.date_time_recovery
-        if time_since_resolution < timedelta(hours=2):
+        if time_since_resolution < ARCHIVE_DELAY:
             return False
         
         return True
@@ -444,6 +517,17 @@ class TransportNetworkIncident(BaseIncident):
         verbose_name = "Transport Network Incident"
         verbose_name_plural = "Transport Network Incidents"
         ordering = ['-date_time_incident']
+        indexes = [
+            # Duplicate-incident probe (same extremities, active, within a time window)
+            models.Index(fields=['extremity_a', 'extremity_b', 'date_time_incident', 'date_time_recovery'], name='transport_dup_extremity_idx'),
+            # Active incidents (date_time_recovery IS NULL) ordered/filtered by incident time
+            models.Index(fields=['date_time_recovery', 'date_time_incident'], name='transport_active_idx'),
+            # List views: non-archived incidents newest first; historical view: resolved newest first
+            models.Index(fields=['is_archived', '-date_time_incident'], name='transport_list_idx'),
+            models.Index(fields=['-date_time_recovery'], name='transport_recovered_idx'),
+            # Unified archive view: archived incidents newest archival first
+            models.Index(fields=['is_archived', '-archived_at'], name='transport_archived_idx'),
+        ]
         
     def get_location_display(self):
         """Return formatted location for display"""
@@ -481,6 +565,15 @@ class FileAccessNetworkIncident(BaseIncident):
         verbose_name = "File Access Network Incident"
         verbose_name_plural = "File Access Network Incidents"
         ordering = ['-date_time_incident']
+        indexes = [
+            # Active incidents (date_time_recovery IS NULL) ordered/filtered by incident time
+            models.Index(fields=['date_time_recovery', 'date_time_incident'], name='fileaccess_active_idx'),
+            # List views: non-archived incidents newest first; historical view: resolved newest first
+            models.Index(fields=['is_archived', '-date_time_incident'], name='fileaccess_list_idx'),
+            models.Index(fields=['-date_time_recovery'], name='fileaccess_recovered_idx'),
+            # Unified archive view: archived incidents newest archival first
+            models.Index(fields=['is_archived', '-archived_at'], name='fileaccess_archived_idx'),
+        ]
     
     def get_location_display(self):
         """Return formatted location for display"""
@@ -513,6 +606,15 @@ class RadioAccessNetworkIncident(BaseIncident):
         verbose_name = "Radio Access Network Incident"
         verbose_name_plural = "Radio Access Network Incidents"
         ordering = ['-date_time_incident']
+        indexes = [
+            # Active incidents (date_time_recovery IS NULL) ordered/filtered by incident time
+            models.Index(fields=['date_time_recovery', 'date_time_incident'], name='radioaccess_active_idx'),
+            # List views: non-archived incidents newest first; historical view: resolved newest first
+            models.Index(fields=['is_archived', '-date_time_incident'], name='radioaccess_list_idx'),
+            models.Index(fields=['-date_time_recovery'], name='radioaccess_recovered_idx'),
+            # Unified archive view: archived incidents newest archival first
+            models.Index(fields=['is_archived', '-archived_at'], name='radioaccess_archived_idx'),
+        ]
     
     def get_location_display(self):
         """Return formatted location for display"""
@@ -579,6 +681,15 @@ class CoreNetworkIncident(BaseIncident):
         verbose_name = "Core Network Incident"
         verbose_name_plural = "Core Network Incidents"
         ordering = ['-date_time_incident']
+        indexes = [
+            # Active incidents (date_time_recovery IS NULL) ordered/filtered by incident time
+            models.Index(fields=['date_time_recovery', 'date_time_incident'], name='core_active_idx'),
+            # List views: non-archived incidents newest first; historical view: resolved newest first
+            models.Index(fields=['is_archived', '-date_time_incident'], name='core_list_idx'),
+            models.Index(fields=['-date_time_recovery'], name='core_recovered_idx'),
+            # Unified archive view: archived incidents newest archival first
+            models.Index(fields=['is_archived', '-archived_at'], name='core_archived_idx'),
+        ]
     
     def get_location_display(self):
         """Return formatted location for display"""
@@ -616,12 +727,31 @@ class BackboneInternetNetworkIncident(BaseIncident):
         verbose_name = "Backbone Internet Network Incident"
         verbose_name_plural = "Backbone Internet Network Incidents"
         ordering = ['-date_time_incident']
+        indexes = [
+            # Active incidents (date_time_recovery IS NULL) ordered/filtered by incident time
+            models.Index(fields=['date_time_recovery', 'date_time_incident'], name='backbone_active_idx'),
+            # List views: non-archived incidents newest first; historical view: resolved newest first
+            models.Index(fields=['is_archived', '-date_time_incident'], name='backbone_list_idx'),
+            models.Index(fields=['-date_time_recovery'], name='backbone_recovered_idx'),
+            # Unified archive view: archived incidents newest archival first
+            models.Index(fields=['is_archived', '-archived_at'], name='backbone_archived_idx'),
+        ]
     
     def get_location_display(self):
         """Return formatted location for display"""
         return f"{self.platform_igw} - {self.link_label}"
 
 
+# Incident model per network type key, shared by services, tasks and dashboard
+NETWORK_MODELS = {
+    'transport': TransportNetworkIncident,
+    'file_access': FileAccessNetworkIncident,
+    'radio_access': RadioAccessNetworkIncident,
+    'core': CoreNetworkIncident,
+    'backbone_internet': BackboneInternetNetworkIncident,
+}
+
+
 # Configuration Models for Admin Panel Dropdown Management
 class DropdownConfiguration(models.Model):
     """
@@ -724,6 +854,39 @@ class AuditLog(models.Model):
     def __str__(self):
         return f"{self.user} {self.action} {self.model_name} at {self.timestamp}"
     
+def summarize_search_params(params):
+    """
+    Return human-readable summary of saved search parameters
+    (usable on .values() rows without loading SavedSearch instances)
+    """
+    summary_parts = []
+    
+    # Status filter
+    if params.get('status'):
+        summary_parts.append(f"Status: {params['status']}")
+    
+    # Date range
+    if params.get('date_from') or params.get('date_to'):
+        date_str = "Date: "
+        if params.get('date_from'):
+            date_str += f"from {params['date_from']}"
+        if params.get('date_to'):
+            date_str += f" to {params['date_to']}"
+        summary_parts.append(date_str.strip())
+    
+    # Cause/Origin
+    if params.get('cause'):
+        summary_parts.append(f"Cause: {params['cause']}")
+    if params.get('origin'):
+        summary_parts.append(f"Origin: {params['origin']}")
+    
+    # Search query
+    if params.get('search_query'):
+        summary_parts.append(f"Search: '{params['search_query']}'")
+    
+    return " | ".join(summary_parts) if summary_parts else "No filters"
+
+
 class SavedSearch(models.Model):
     """
     Saved search filters for users to quickly access common searches
@@ -807,33 +970,7 @@ class SavedSearch(models.Model):
     
     def get_params_summary(self):
         """Return human-readable summary of search parameters"""
-        params = self.search_params
-        summary_parts = []
-        
-        # Status filter
-        if params.get('status'):
-            summary_parts.append(f"Status: {params['status']}")
-        
-        # Date range
-        if params.get('date_from') or params.get('date_to'):
-            date_str = "Date: "
-            if params.get('date_from'):
-                date_str += f"from {params['date_from']}"
-            if params.get('date_to'):
-                date_str += f" to {params['date_to']}"
-            summary_parts.append(date_str.strip())
-        
-        # Cause/Origin
-        if params.get('cause'):
-            summary_parts.append(f"Cause: {params['cause']}")
-        if params.get('origin'):
-            summary_parts.append(f"Origin: {params['origin']}")
-        
-        # Search query
-        if params.get('search_query'):
-            summary_parts.append(f"Search: '{params['search_query']}'")
-        
-        return " | ".join(summary_parts) if summary_parts else "No filters"
+        return summarize_search_params(self.search_params)
 
 
 class SystemConfiguration(models.Model):
@@ -0,0 +1,134 @@
+from collections.abc import Sequence
+
+from django.core.paginator import Paginator
+
+
+class DeferredJoinPaginator(Paginator):
+    """
+    Paginator for large incident querysets.
+    
+    Deep OFFSET pages are resolved against the primary key only (a narrow index
+    scan), then the full rows - including select_related joins - are fetched
+    for just that page's keys. MySQL does not allow LIMIT inside an IN
+    subquery, so the page keys are fetched in a separate, cheap query.
+    
+    A precomputed total can be passed as count (e.g. from a cached statistics
+    aggregate) to skip the paginator's own COUNT(*) query.
+    """
+    
+    def __init__(self, object_list, per_page, *args, count=None, **kwargs):
+        super().__init__(object_list, per_page, *args, **kwargs)
+        if count is not None:
+            # Pre-fill the cached_property so Paginator never runs COUNT(*)
+            self.__dict__['count'] = count
+    
+    def page(self, number):
+        number = self.validate_number(number)
+        bottom = (number - 1) * self.per_page
+        top = bottom + self.per_page
+        if top + self.orphans >= self.count:
+            top = self.count
+        
+        pks = list(self.object_list.values_list('pk', flat=True)[bottom:top])
+        rows = {row.pk: row for row in self.object_list.filter(pk__in=pks)}
+        
+        # Keep the original ordering of the page
+        return self._get_page([rows[pk] for pk in pks if pk in rows], number, self)
+
+
+class UnionPaginator(DeferredJoinPaginator):
+    """
+    Paginator for a UNION ALL across several incident models.
+    
+    The union only selects narrow (id, network_type_key) rows; once the page is
+    sliced, the full rows are loaded with one in_bulk() per network from
+    querysets[network_type_key], tagged with network_type_key and returned in
+    the union's order.
+    """
+    
+    def __init__(self, object_list, per_page, querysets, *args, **kwargs):
+        super().__init__(object_list, per_page, *args, **kwargs)
+        self.querysets = querysets
+    
+    def page(self, number):
+        number = self.validate_number(number)
+        bottom = (number - 1) * self.per_page
+        top = bottom + self.per_page
+        if top + self.orphans >= self.count:
+            top = self.count
+        
+        keys = [(row['network_type_key'], row['id']) for row in self.object_list[bottom:top]]
+        ids_by_network = {}
+        for network_type_key, pk in keys:
+            ids_by_network.setdefault(network_type_key, []).append(pk)
+        
+        rows = {}
+        for network_type_key, ids in ids_by_network.items():
+            for pk, row in self.querysets[network_type_key].in_bulk(ids).items():
+                row.network_type_key = network_type_key
+                rows[(network_type_key, pk)] = row
+        
+        return self._get_page([rows[key] for key in keys if key in rows], number, self)
+
+
+class LitePage(Sequence):
+    """A page from LitePaginator: the page's rows plus whether a next page exists"""
+    
+    def __init__(self, object_list, number, has_next_page):
+        self.object_list = object_list
+        self.number = number
+        self._has_next = has_next_page
+    
+    def __repr__(self):
+        return f"<LitePage {self.number}>"
+    
+    def __len__(self):
+        return len(self.object_list)
+    
+    def __getitem__(self, index):
+        return self.object_list[index]
+    
+    def has_next(self):
+        return self._has_next
+    
+    def has_previous(self):
+        return self.number > 1
+    
+    def has_other_pages(self):
+        return self.has_next() or self.has_previous()
+    
+    def next_page_number(self):
+        return self.number + 1
+    
+    def previous_page_number(self):
+        return self.number - 1
+
+
+class LitePaginator:
+    """
+    Count-free paginator for listings that only need previous/next links.
+    
+    Each page fetches per_page + 1 keys; the extra key only tells whether a
+    next page exists, so no COUNT(*) query is ever run. Pages expose the
+    Page navigation methods but not num_pages or the total count.
+    """
+    
+    def __init__(self, object_list, per_page):
+        self.object_list = object_list
+        self.per_page = int(per_page)
+    
+    def get_page(self, number):
+        """Return a valid page, falling back to the first page on bad input"""
+        try:
+            number = max(int(number), 1)
+        except (TypeError, ValueError):
+            number = 1
+        
+        bottom = (number - 1) * self.per_page
+        # Deferred join, as in DeferredJoinPaginator: OFFSET over the primary key only,
+        # then the full rows for this page's keys
+        pks = list(self.object_list.values_list('pk', flat=True)[bottom:bottom + self.per_page + 1])
+        has_next_page = len(pks) > self.per_page
+        pks = pks[:self.per_page]
+        rows = {row.pk: row for row in self.object_list.filter(pk__in=pks)}
+        return LitePage([rows[pk] for pk in pks if pk in rows], number, has_next_page)
@@ -0,0 +1,31 @@
+from django.db.models.signals import post_save, post_delete
+
+from .models import (
+    TransportNetworkIncident, FileAccessNetworkIncident, RadioAccessNetworkIncident,
+    CoreNetworkIncident, BackboneInternetNetworkIncident, DropdownConfiguration
+)
+from .utils import invalidate_network_statistics, invalidate_dropdown_choices
+
+# Incident model -> network_type key used by get_network_statistics
+_NETWORK_TYPE_BY_MODEL = {
+    TransportNetworkIncident: 'transport',
+    FileAccessNetworkIncident: 'file_access',
+    RadioAccessNetworkIncident: 'radio_access',
+    CoreNetworkIncident: 'core',
+    BackboneInternetNetworkIncident: 'backbone_internet',
+}
+
+def invalidate_statistics_on_incident_change(sender, **kwargs):
+    """Keep cached network statistics fresh when an incident is created, edited or deleted"""
+    invalidate_network_statistics(_NETWORK_TYPE_BY_MODEL[sender])
+
+for _model in _NETWORK_TYPE_BY_MODEL:
+    post_save.connect(invalidate_statistics_on_incident_change, sender=_model)
+    post_delete.connect(invalidate_statistics_on_incident_change, sender=_model)
+
+def invalidate_dropdown_cache_on_change(sender, instance, **kwargs):
+    """Refresh cached dropdown options when an admin edits a configuration value"""
+    invalidate_dropdown_choices(instance.category)
+
+post_save.connect(invalidate_dropdown_cache_on_change, sender=DropdownConfiguration)
+post_delete.connect(invalidate_dropdown_cache_on_change, sender=DropdownConfiguration)
@@ -3,9 +3,23 @@ from django import template
 from django.utils import timezone
 from django.utils.safestring import mark_safe
 import math
+from incidents.models import (
+    TransportNetworkIncident, FileAccessNetworkIncident,
+    RadioAccessNetworkIncident, CoreNetworkIncident,
+    BackboneInternetNetworkIncident
+)
 
 register = template.Library()
 
+# Display name for each incident model class
+_NETWORK_TYPE_BY_CLASS = {
+    TransportNetworkIncident: 'Transport Networks',
+    FileAccessNetworkIncident: 'File Access Networks',
+    RadioAccessNetworkIncident: 'Radio Access Networks',
+    CoreNetworkIncident: 'Core Networks',
+    BackboneInternetNetworkIncident: 'Backbone Internet Networks',
+}
+
 @register.filter
 def severity_class(incident):
     """
@@ -239,18 +253,7 @@ def get_network_type(incident):
     if hasattr(incident, 'get_network_type'):
         return incident.get_network_type()
     
-    class_name = incident.__class__.__name__
-    if 'Transport' in class_name:
-        return 'Transport Networks'
-    elif 'FileAccess' in class_name:
-        return 'File Access Networks'
-    elif 'RadioAccess' in class_name:
-        return 'Radio Access Networks'
-    elif 'Core' in class_name:
-        return 'Core Networks'
-    elif 'BackboneInternet' in class_name:
-        return 'Backbone Internet Networks'
-    return 'Unknown Network'
+    return _NETWORK_TYPE_BY_CLASS.get(type(incident), 'Unknown Network')
 
 @register.filter
 def truncate_id(uuid_string, length=8):
@@ -1,3 +1,307 @@
-from django.test import TestCase
+import json
+from datetime import timedelta
+from unittest import mock
 
-# Create your tests here.
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
+from django.core.paginator import EmptyPage
+from django.db import connection
+from django.db.models import CharField, Value
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from incident_management.celery import app as celery_app
+
+from .models import AuditLog, BackboneInternetNetworkIncident, TransportNetworkIncident
+from .pagination import DeferredJoinPaginator, LitePaginator, UnionPaginator
+from .validators import DuplicateIncidentChecker
+
+LOCMEM_CACHES = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}}
+
+
+def create_transport_incident(user, **kwargs):
+    """Create a transport incident with the required fields filled in"""
+    now = timezone.now()
+    fields = {
+        'date_time_incident': now - timedelta(hours=3),
+        'region_loop': 'Region 1',
+        'system_capacity': 'STM-16',
+        'extremity_a': 'Site A',
+        'extremity_b': 'Site B',
+        'cause': 'Fiber cut',
+        'origin': 'Third party',
+        'created_by': user,
+    }
+    fields.update(kwargs)
+    return TransportNetworkIncident.objects.create(**fields)
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class UnifiedHistoricalViewTests(TestCase):
+    """Tests for the unified archived incidents page"""
+    
+    def setUp(self):
+        cache.clear()
+        self.user = get_user_model().objects.create_user(username='operator', password='secret')
+        self.client.force_login(self.user)
+    
+    def create_archived(self, count):
+        now = timezone.now()
+        for _ in range(count):
+            create_transport_incident(
+                self.user, date_time_recovery=now - timedelta(hours=2),
+                is_archived=True, archived_at=now, archived_by=self.user,
+            )
+    
+    def count_page_queries(self):
+        cache.clear()
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse('incidents:unified_historical'))
+        self.assertEqual(response.status_code, 200)
+        return len(queries)
+    
+    def test_query_count_does_not_grow_with_rows(self):
+        # Every column the rows render is loaded up front, so no per-row deferred loads
+        self.create_archived(1)
+        single_row_queries = self.count_page_queries()
+        
+        self.create_archived(4)
+        self.assertEqual(self.count_page_queries(), single_row_queries)
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class NetworkIncidentsViewTests(TestCase):
+    """Tests for the per-network incident list"""
+    
+    def setUp(self):
+        cache.clear()
+        self.user = get_user_model().objects.create_user(username='operator', password='secret')
+        self.client.force_login(self.user)
+        self.url = reverse('incidents:transport_incidents')
+    
+    def count_page_queries(self, params):
+        cache.clear()
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.url, params)
+        self.assertEqual(response.status_code, 200)
+        return len(queries)
+    
+    def test_search_query_count_does_not_grow_with_rows(self):
+        # can_be_archived() on each row must not trigger deferred-field loads
+        params = {'search_query': 'Fiber', 'sort_by': '-date_time_incident'}
+        create_transport_incident(self.user)
+        single_row_queries = self.count_page_queries(params)
+        
+        for _ in range(4):
+            create_transport_incident(self.user)
+        self.assertEqual(self.count_page_queries(params), single_row_queries)
+    
+    def test_search_without_sort_by_uses_default_order(self):
+        older = create_transport_incident(self.user, date_time_incident=timezone.now() - timedelta(hours=5))
+        newer = create_transport_incident(self.user)
+        
+        response = self.client.get(self.url, {'search_query': 'Fiber'})
+        
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.context['search_active'])
+        self.assertEqual([incident.pk for incident in response.context['incidents']], [newer.pk, older.pk])
+
+
+class SeverityTests(TestCase):
+    """The SQL severity annotation agrees with the Python age thresholds"""
+    
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(username='operator', password='secret')
+        now = timezone.now()
+        for hours in (0.5, 1.5, 3, 5):
+            create_transport_incident(self.user, date_time_incident=now - timedelta(hours=hours))
+        create_transport_incident(self.user, date_time_recovery=now - timedelta(minutes=10))
+    
+    def test_annotated_severity_matches_get_severity_class(self):
+        annotated = TransportNetworkIncident.with_severity(TransportNetworkIncident.objects.all())
+        levels = {}
+        for incident in annotated:
+            # A fresh instance has no annotation, so get_severity_class() computes the age in Python
+            plain = TransportNetworkIncident.objects.get(pk=incident.pk)
+            self.assertEqual(f'incident-{incident.severity}', plain.get_severity_class())
+            levels[incident.severity] = levels.get(incident.severity, 0) + 1
+        
+        self.assertEqual(levels, {'new': 1, 'low': 1, 'medium': 1, 'critical': 1, 'resolved': 1})
+    
+    def test_severity_counts_fill_every_active_bucket(self):
+        counts = TransportNetworkIncident.severity_counts(TransportNetworkIncident.objects.all())
+        self.assertEqual(counts, {'new': 1, 'low': 1, 'medium': 1, 'critical': 1})
+
+class DuplicateIncidentCheckerTests(TestCase):
+    """Tests for the single-query duplicate incident probe"""
+    
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(username='operator', password='secret')
+        self.incident = create_transport_incident(self.user)
+    
+    def test_active_incident_with_same_extremities_is_a_duplicate(self):
+        with self.assertRaises(ValidationError):
+            DuplicateIncidentChecker.check_all(
+                TransportNetworkIncident,
+                incident_time=self.incident.date_time_incident + timedelta(minutes=30),
+                extremity_a='site a', extremity_b='SITE B',
+            )
+    
+    def test_excluded_and_resolved_incidents_are_not_duplicates(self):
+        DuplicateIncidentChecker.check_all(
+            TransportNetworkIncident,
+            incident_time=self.incident.date_time_incident,
+            extremity_a='Site A', extremity_b='Site B', exclude_id=self.incident.pk,
+        )
+        
+        self.incident.date_time_recovery = timezone.now()
+        self.incident.save()
+        DuplicateIncidentChecker.check_all(
+            TransportNetworkIncident,
+            incident_time=self.incident.date_time_incident,
+            extremity_a='Site A', extremity_b='Site B',
+        )
+
+
+@override_settings(CACHES=LOCMEM_CACHES, CELERY_TASK_ALWAYS_EAGER=True)
+class ExportAuditLogTests(TestCase):
+    """Export audit entries are written whether or not the broker is reachable"""
+    
+    def setUp(self):
+        cache.clear()
+        self.user = get_user_model().objects.create_user(username='operator', password='secret')
+        self.client.force_login(self.user)
+        create_transport_incident(self.user)
+        # The Celery app read its configuration at startup, so apply eager mode to it directly
+        patcher = mock.patch.object(celery_app.conf, 'task_always_eager', True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+    
+    def export(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(
+                reverse('incidents:export_incidents', args=['transport']),
+                data=json.dumps({'format': 'csv'}),
+                content_type='application/json',
+            )
+        self.assertEqual(response.status_code, 200)
+        b''.join(response.streaming_content)
+    
+    def test_export_records_audit_log(self):
+        self.export()
+        entry = AuditLog.objects.get(action='EXPORT')
+        self.assertEqual(entry.user, self.user)
+        self.assertEqual(entry.changes, {'format': 'csv', 'count': 1})
+    
+    def test_export_records_audit_log_when_broker_is_down(self):
+        with mock.patch('incidents.tasks.record_audit_log.delay', side_effect=ConnectionError):
+            self.export()
+        self.assertTrue(AuditLog.objects.filter(action='EXPORT', user=self.user).exists())
+
+
+class PaginatorTests(TestCase):
+    """Tests for the deferred-join, union and count-free paginators"""
+    
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(username='operator', password='secret')
+        now = timezone.now()
+        # Five incidents, newest first once ordered by -date_time_incident
+        self.incidents = [
+            create_transport_incident(self.user, date_time_incident=now - timedelta(hours=hours))
+            for hours in range(1, 6)
+        ]
+        self.queryset = TransportNetworkIncident.objects.order_by('-date_time_incident')
+    
+    def page_pks(self, page):
+        return [incident.pk for incident in page]
+    
+    def test_deferred_join_page_boundaries_keep_order(self):
+        paginator = DeferredJoinPaginator(self.queryset, 2)
+        pks = [incident.pk for incident in self.incidents]
+        
+        self.assertEqual(paginator.num_pages, 3)
+        self.assertEqual(self.page_pks(paginator.page(1)), pks[0:2])
+        self.assertEqual(self.page_pks(paginator.page(2)), pks[2:4])
+        
+        last_page = paginator.page(3)
+        self.assertEqual(self.page_pks(last_page), pks[4:5])
+        self.assertFalse(last_page.has_next())
+        with self.assertRaises(EmptyPage):
+            paginator.page(4)
+    
+    def test_deferred_join_empty_result(self):
+        paginator = DeferredJoinPaginator(self.queryset.none(), 2)
+        
+        page = paginator.page(1)
+        self.assertEqual(list(page), [])
+        self.assertFalse(page.has_next())
+    
+    def test_deferred_join_uses_injected_count(self):
+        # The injected count is trusted as-is, so a smaller value proves COUNT(*) never ran
+        paginator = DeferredJoinPaginator(self.queryset, 2, count=3)
+        
+        with self.assertNumQueries(2):
+            self.assertEqual(paginator.num_pages, 2)
+            page = paginator.page(2)
+        self.assertEqual(self.page_pks(page), [self.incidents[2].pk])
+    
+    def test_lite_paginator_has_next_without_count(self):
+        paginator = LitePaginator(self.queryset, 2)
+        pks = [incident.pk for incident in self.incidents]
+        
+        with self.assertNumQueries(2):
+            page = paginator.get_page(2)
+        self.assertEqual(self.page_pks(page), pks[2:4])
+        self.assertTrue(page.has_next())
+        self.assertTrue(page.has_previous())
+        
+        last_page = paginator.get_page(3)
+        self.assertEqual(self.page_pks(last_page), pks[4:5])
+        self.assertFalse(last_page.has_next())
+    
+    def test_lite_paginator_exact_multiple_and_bad_input(self):
+        self.incidents[-1].delete()
+        paginator = LitePaginator(self.queryset, 2)
+        
+        # Four rows fill page 2 exactly; the extra key probe finds nothing beyond it
+        self.assertFalse(paginator.get_page(2).has_next())
+        self.assertEqual(list(paginator.get_page(3)), [])
+        self.assertEqual(paginator.get_page('abc').number, 1)
+        self.assertEqual(paginator.get_page(0).number, 1)
+    
+    def test_union_paginator_reorders_rows_and_tags_network(self):
+        now = timezone.now()
+        backbone = BackboneInternetNetworkIncident.objects.create(
+            date_time_incident=now - timedelta(minutes=150),
+            interconnect_type='IX', platform_igw='IGW 1', link_label='Link 1',
+            created_by=self.user,
+        )
+        querysets = {
+            'transport': TransportNetworkIncident.objects.all(),
+            'backbone_internet': BackboneInternetNetworkIncident.objects.all(),
+        }
+        union = querysets['transport'].annotate(
+            network_type_key=Value('transport', output_field=CharField())
+        ).values('id', 'date_time_incident', 'network_type_key').union(
+            querysets['backbone_internet'].annotate(
+                network_type_key=Value('backbone_internet', output_field=CharField())
+            ).values('id', 'date_time_incident', 'network_type_key'),
+            all=True,
+        ).order_by('-date_time_incident')
+        paginator = UnionPaginator(union, 3, querysets=querysets, count=6)
+        
+        # The backbone incident (2.5h old) sits between the 2h and 3h transport incidents
+        page = paginator.page(1)
+        self.assertEqual(
+            [(incident.network_type_key, incident.pk) for incident in page],
+            [
+                ('transport', self.incidents[0].pk),
+                ('transport', self.incidents[1].pk),
+                ('backbone_internet', backbone.pk),
+            ]
+        )
+        self.assertIsInstance(page[2], BackboneInternetNetworkIncident)
+        self.assertEqual(self.page_pks(paginator.page(2)), [incident.pk for incident in self.incidents[2:5]])
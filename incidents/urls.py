@@ -3,42 +3,29 @@ from . import views
 
 app_name = 'incidents'
 
-urlpatterns = [
-    # Transport Networks
-    path('transport-networks/', views.network_incidents_view, {'network_type': 'transport'}, name='transport_incidents'),
-    path('transport-networks/add/', views.add_incident_view, {'network_type': 'transport'}, name='add_transport_incident'),
-    path('transport-networks/edit/<uuid:incident_id>/', views.edit_incident_view, {'network_type': 'transport'}, name='edit_transport_incident'),
-    path('transport-networks/historical/', views.historical_incidents_view, {'network_type': 'transport'}, name='transport_historical'),
-    path('transport-networks/notification/<uuid:incident_id>/', views.incident_notification_prompt, {'network_type': 'transport'}, name='transport_incidents_with_notification'),
-    
-    # File Access Networks
-    path('file-access-networks/', views.network_incidents_view, {'network_type': 'file_access'}, name='file_access_incidents'),
-    path('file-access-networks/add/', views.add_incident_view, {'network_type': 'file_access'}, name='add_file_access_incident'),
-    path('file-access-networks/edit/<uuid:incident_id>/', views.edit_incident_view, {'network_type': 'file_access'}, name='edit_file_access_incident'),
-    path('file-access-networks/historical/', views.historical_incidents_view, {'network_type': 'file_access'}, name='file_access_historical'),
-    path('file-access-networks/notification/<uuid:incident_id>/', views.incident_notification_prompt, {'network_type': 'file_access'}, name='file_access_incidents_with_notification'),
-    
-    # Radio Access Networks
-    path('radio-access-networks/', views.network_incidents_view, {'network_type': 'radio_access'}, name='radio_access_incidents'),
-    path('radio-access-networks/add/', views.add_incident_view, {'network_type': 'radio_access'}, name='add_radio_access_incident'),
-    path('radio-access-networks/edit/<uuid:incident_id>/', views.edit_incident_view, {'network_type': 'radio_access'}, name='edit_radio_access_incident'),
-    path('radio-access-networks/historical/', views.historical_incidents_view, {'network_type': 'radio_access'}, name='radio_access_historical'),
-    path('radio-access-networks/notification/<uuid:incident_id>/', views.incident_notification_prompt, {'network_type': 'radio_access'}, name='radio_access_incidents_with_notification'),
-    
-    # Core Networks
-    path('core-networks/', views.network_incidents_view, {'network_type': 'core'}, name='core_incidents'),
-    path('core-networks/add/', views.add_incident_view, {'network_type': 'core'}, name='add_core_incident'),
-    path('core-networks/edit/<uuid:incident_id>/', views.edit_incident_view, {'network_type': 'core'}, name='edit_core_incident'),
-    path('core-networks/historical/', views.historical_incidents_view, {'network_type': 'core'}, name='core_historical'),
-    path('core-networks/notification/<uuid:incident_id>/', views.incident_notification_prompt, {'network_type': 'core'}, name='core_incidents_with_notification'),
-    
-    # Backbone Internet Networks
-    path('backbone-internet-networks/', views.network_incidents_view, {'network_type': 'backbone_internet'}, name='backbone_internet_incidents'),
-    path('backbone-internet-networks/add/', views.add_incident_view, {'network_type': 'backbone_internet'}, name='add_backbone_internet_incident'),
-    path('backbone-internet-networks/edit/<uuid:incident_id>/', views.edit_incident_view, {'network_type': 'backbone_internet'}, name='edit_backbone_internet_incident'),
-    path('backbone-internet-networks/historical/', views.historical_incidents_view, {'network_type': 'backbone_internet'}, name='backbone_internet_historical'),
-    path('backbone-internet-networks/notification/<uuid:incident_id>/', views.incident_notification_prompt, {'network_type': 'backbone_internet'}, name='backbone_internet_incidents_with_notification'),
-    
+# (network_type key, URL slug) for every incident network
+NETWORK_TYPES = (
+    ('transport', 'transport-networks'),
+    ('file_access', 'file-access-networks'),
+    ('radio_access', 'radio-access-networks'),
+    ('core', 'core-networks'),
+    ('backbone_internet', 'backbone-internet-networks'),
+)
+
+urlpatterns = []
+
+# Per-network list/add/edit/historical/notification routes
+for net, slug in NETWORK_TYPES:
+    kwargs = {'network_type': net}
+    urlpatterns += [
+        path(f'{slug}/', views.network_incidents_view, kwargs, name=f'{net}_incidents'),
+        path(f'{slug}/add/', views.add_incident_view, kwargs, name=f'add_{net}_incident'),
+        path(f'{slug}/edit/<uuid:incident_id>/', views.edit_incident_view, kwargs, name=f'edit_{net}_incident'),
+        path(f'{slug}/historical/', views.historical_incidents_view, kwargs, name=f'{net}_historical'),
+        path(f'{slug}/notification/<uuid:incident_id>/', views.incident_notification_prompt, kwargs, name=f'{net}_incidents_with_notification'),
+    ]
+
+urlpatterns += [
     # Unified Historical View (All Networks)
     path('historical/', views.unified_historical_incidents_view, name='unified_historical'),
     path('historical/restore/<uuid:incident_id>/<str:network_type>/', views.restore_archived_incident, name='restore_incident'),
@@ -51,6 +38,7 @@ urlpatterns = [
 
     # Incident detail modal endpoint
     path('<str:network_type>/detail/<uuid:incident_id>/', views.get_incident_detail, name='incident_detail'),
+    path('<str:network_type>/severity-counts/', views.severity_counts_view, name='severity_counts'),
 
     # Saved Search endpoints (Task 1: Phase 4)
     path('saved-search/<str:network_type>/save/', views.save_search_view, name='save_search'),
@@ -1,5 +1,20 @@
+from django.core.cache import cache
 from django.utils import timezone
+from django.db.models import Count, Q
 from datetime import timedelta
+from functools import lru_cache
+from itertools import groupby
+import hashlib
+import logging
+import time
+from .models import DropdownConfiguration, NETWORK_MODELS
+
+logger = logging.getLogger(__name__)
+
+# Severity age thresholds, compared directly as timedeltas
+_H1 = timedelta(hours=1)
+_H2 = timedelta(hours=2)
+_H4 = timedelta(hours=4)
 
 def get_incident_color_class(incident):
     """
@@ -22,14 +37,11 @@ def get_incident_color_class(incident):
         now = timezone.now()
         duration = now - incident.date_time_incident
         
-        # Convert to hours for comparison
-        hours = duration.total_seconds() / 3600
-        
-        if hours > 4:
+        if duration > _H4:
             return 'incident-critical'  # Red background
-        elif hours > 2:
+        elif duration > _H2:
             return 'incident-major'     # Orange background
-        elif hours > 1:
+        elif duration > _H1:
             return 'incident-minor'     # Yellow background
         else:
             return 'incident-new'       # White background
@@ -50,21 +62,18 @@ def format_incident_duration(incident):
     duration = end_time - incident.date_time_incident
     
     # Calculate days, hours, and minutes
-    total_seconds = int(duration.total_seconds())
-    days = total_seconds // (24 * 3600)
-    hours = (total_seconds % (24 * 3600)) // 3600
-    minutes = (total_seconds % 3600) // 60
+    minutes = int(duration.total_seconds()) // 60
+    hours, minutes = divmod(minutes, 60)
+    days, hours = divmod(hours, 24)
     
-    # Format the string
-    parts = []
+    # Format the string, skipping zero parts (always show minutes if nothing else)
     if days > 0:
-        parts.append(f"{days}d")
+        if hours > 0:
+            return f"{days}d {hours}h {minutes}m" if minutes > 0 else f"{days}d {hours}h"
+        return f"{days}d {minutes}m" if minutes > 0 else f"{days}d"
     if hours > 0:
-        parts.append(f"{hours}h")
-    if minutes > 0 or len(parts) == 0:  # Always show minutes if nothing else
-        parts.append(f"{minutes}m")
-    
-    return " ".join(parts)
+        return f"{hours}h {minutes}m" if minutes > 0 else f"{hours}h"
+    return f"{minutes}m"
 
 def validate_incident_data(incident_data, network_type):
     """
@@ -77,7 +86,7 @@ def validate_incident_data(incident_data, network_type):
     required_fields = get_required_fields_by_network(network_type)
     
     for field in required_fields:
-        if field not in incident_data or not incident_data[field]:
+        if not incident_data.get(field):
             field_name = field.replace('_', ' ').title()
             errors.append(f"{field_name} is required")
     
@@ -91,29 +100,114 @@ def validate_incident_data(incident_data, network_type):
     
     return len(errors) == 0, errors
 
+# Required fields for each network type (tuples: immutable and built once)
+_REQUIRED_FIELDS = {
+    'transport': (
+        'date_time_incident', 'region_loop', 'system_capacity', 
+        'extremity_a', 'extremity_b', 'dot_extremity_b'
+    ),
+    'file_access': (
+        'date_time_incident', 'do_wilaya', 'zone_metro', 'site', 'ip_address'
+    ),
+    'radio_access': (
+        'date_time_incident', 'do_wilaya', 'site', 'ip_address'
+    ),
+    'core': (
+        'date_time_incident', 'platform', 'region_node', 'extremity_a', 'extremity_b', 'dot_extremity_b'
+    ),
+    'backbone_internet': (
+        'date_time_incident', 'interconnect_type', 'platform_igw', 'link_label'
+    )
+}
+
+@lru_cache(maxsize=8)
 def get_required_fields_by_network(network_type):
     """
-    Return list of required fields for each network type
-    """
-    field_map = {
-        'transport': [
-            'date_time_incident', 'region_loop', 'system_capacity', 
-            'extremity_a', 'extremity_b', 'dot_extremity_b'
-        ],
-        'file_access': [
-            'date_time_incident', 'do_wilaya', 'zone_metro', 'site', 'ip_address'
-        ],
-        'radio_access': [
-            'date_time_incident', 'do_wilaya', 'site', 'ip_address'
-        ],
-        'core': [
-            'date_time_incident', 'platform', 'region_node', 'extremity_a', 'extremity_b', 'dot_extremity_b'
-        ],
-        'backbone_internet': [
-            'date_time_incident', 'interconnect_type', 'platform_igw', 'link_label'
-        ]
+    Return tuple of required fields for each network type
+    """
+    return _REQUIRED_FIELDS.get(network_type, ())
+
+# Statistics are cached per network for a short bucket so frequent dashboard polls share one query
+_STATS_TTL = 30
+
+def _network_statistics_key(network_type):
+    return f"netstats:{network_type}:{int(time.time() // _STATS_TTL)}"
+
+def invalidate_network_statistics(network_type):
+    """Drop the cached statistics for the current bucket (called when incidents change)"""
+    cache.delete(_network_statistics_key(network_type))
+    # Retire every cached list count for this network
+    cache.set(_list_version_key(network_type), time.time_ns(), None)
+
+def _list_version_key(network_type):
+    return f"listver:{network_type}"
+
+def get_list_count_cache_key(network_type, filters=None):
+    """
+    Cache key for the counts of a network's incident list under the given search
+    filters. Keys are versioned per network, so any incident change retires them.
+    """
+    version = cache.get_or_set(_list_version_key(network_type), 0, None)
+    signature = sorted((key, str(value)) for key, value in (filters or {}).items() if value)
+    digest = hashlib.md5(repr(signature).encode()).hexdigest()
+    return f"count:{network_type}:{version}:{digest}"
+
+def get_archive_cache_key(filters=None):
+    """
+    Cache key for the unified archive view's summary under the given filters.
+    Archiving or restoring changes an incident, which bumps its network's list
+    version and so retires the key.
+    """
+    version_keys = [_list_version_key(network_type) for network_type in NETWORK_MODELS]
+    versions = cache.get_many(version_keys)
+    signature = (
+        [versions.get(key, 0) for key in version_keys],
+        sorted((key, str(value)) for key, value in (filters or {}).items() if value),
+    )
+    digest = hashlib.md5(repr(signature).encode()).hexdigest()
+    return f"archive:{digest}"
+
+def _compute_network_statistics(model_class):
+    now = timezone.now()
+    one_hour_ago = now - _H1
+    two_hours_ago = now - _H2
+    four_hours_ago = now - _H4
+    active_filter = Q(date_time_recovery__isnull=True)
+    
+    # Totals and severity buckets (for active incidents only) in a single query,
+    # using the same thresholds as get_incident_color_class
+    stats = model_class.objects.aggregate(
+        total=Count('id'),
+        active=Count('id', filter=active_filter),
+        new=Count('id', filter=active_filter & Q(date_time_incident__gte=one_hour_ago)),
+        minor=Count('id', filter=active_filter & Q(
+            date_time_incident__lt=one_hour_ago, date_time_incident__gte=two_hours_ago
+        )),
+        major=Count('id', filter=active_filter & Q(
+            date_time_incident__lt=two_hours_ago, date_time_incident__gte=four_hours_ago
+        )),
+        critical=Count('id', filter=active_filter & Q(date_time_incident__lt=four_hours_ago)),
+    )
+    
+    total = stats['total']
+    active = stats['active']
+    resolved = total - active
+    
+    severity_counts = {
+        'new': stats['new'],            # < 1 hour
+        'minor': stats['minor'],        # 1-2 hours
+        'major': stats['major'],        # 2-4 hours
+        'critical': stats['critical']   # > 4 hours
+    }
+    
+    return {
+        'total': total,
+        'active': active,
+        'resolved': resolved,
+        'active_percentage': round((active / total * 100) if total > 0 else 0, 1),
+        'resolved_percentage': round((resolved / total * 100) if total > 0 else 0, 1),
+        'severity_counts': severity_counts
     }
-    return field_map.get(network_type, [])
 
 def get_network_statistics(network_type, model_class):
     """
@@ -121,42 +215,14 @@ def get_network_statistics(network_type, model_class):
     Returns: dict with counts and percentages
     """
     try:
-        total = model_class.objects.count()
-        active = model_class.objects.filter(date_time_recovery__isnull=True).count()
-        resolved = model_class.objects.filter(date_time_recovery__isnull=False).count()
-        
-        # Get incidents by severity (for active incidents only)
-        active_incidents = model_class.objects.filter(date_time_recovery__isnull=True)
-        
-        severity_counts = {
-            'new': 0,      # < 1 hour
-            'minor': 0,    # 1-2 hours
-            'major': 0,    # 2-4 hours
-            'critical': 0  # > 4 hours
-        }
-        
-        for incident in active_incidents:
-            color_class = get_incident_color_class(incident)
-            if color_class == 'incident-new':
-                severity_counts['new'] += 1
-            elif color_class == 'incident-minor':
-                severity_counts['minor'] += 1
-            elif color_class == 'incident-major':
-                severity_counts['major'] += 1
-            elif color_class == 'incident-critical':
-                severity_counts['critical'] += 1
-        
-        return {
-            'total': total,
-            'active': active,
-            'resolved': resolved,
-            'active_percentage': round((active / total * 100) if total > 0 else 0, 1),
-            'resolved_percentage': round((resolved / total * 100) if total > 0 else 0, 1),
-            'severity_counts': severity_counts
-        }
+        return cache.get_or_set(
+            _network_statistics_key(network_type),
+            lambda: _compute_network_statistics(model_class),
+            _STATS_TTL
+        )
     
-    except Exception as e:
-        print(f"Error calculating statistics for {network_type}: {e}")
+    except Exception:
+        logger.exception("Error calculating statistics for %s", network_type)
         return {
             'total': 0,
             'active': 0,
@@ -173,18 +239,22 @@ def clean_string_field(value, max_length=None):
     if not value:
         return None
     
-    # Strip whitespace
+    # Strip whitespace; empty after stripping means no value
     value = str(value).strip()
-    
-    # Check if empty after stripping
     if not value:
         return None
     
-    # Truncate if too long
-    if max_length and len(value) > max_length:
-        value = value[:max_length]
-    
-    return value
+    # Only slice (copy) when the value is actually too long
+    return value[:max_length] if max_length and len(value) > max_length else value
+
+# Key identifying information per network type, used by get_incident_summary_text
+_SUMMARY_FORMATTERS = {
+    'transport': lambda i: f"({i.extremity_a} to {i.extremity_b})",
+    'file_access': lambda i: f"Site: {i.site} ({i.ip_address})",
+    'radio_access': lambda i: f"Site: {i.site} ({i.ip_address})",
+    'core': lambda i: f"{i.platform} - {i.region_node}",
+    'backbone_internet': lambda i: f"{i.platform_igw} - {i.link_label}",
+}
 
 def get_incident_summary_text(incident, network_type):
     """
@@ -196,21 +266,58 @@ def get_incident_summary_text(incident, network_type):
     summary_parts.append(f"{network_type.replace('_', ' ').title()} Network")
     
     # Add key identifying information based on network type
-    if network_type == 'transport':
-        if hasattr(incident, 'extremity_a') and hasattr(incident, 'extremity_b'):
-            summary_parts.append(f"({incident.extremity_a} to {incident.extremity_b})")
-    elif network_type in ['file_access', 'radio_access']:
-        if hasattr(incident, 'site') and hasattr(incident, 'ip_address'):
-            summary_parts.append(f"Site: {incident.site} ({incident.ip_address})")
-    elif network_type == 'core':
-        if hasattr(incident, 'platform') and hasattr(incident, 'region_node'):
-            summary_parts.append(f"{incident.platform} - {incident.region_node}")
-    elif network_type == 'backbone_internet':
-        if hasattr(incident, 'platform_igw') and hasattr(incident, 'link_label'):
-            summary_parts.append(f"{incident.platform_igw} - {incident.link_label}")
+    formatter = _SUMMARY_FORMATTERS.get(network_type)
+    if formatter:
+        try:
+            summary_parts.append(formatter(incident))
+        except AttributeError:
+            pass
     
     # Add duration
     duration = format_incident_duration(incident)
     summary_parts.append(f"Duration: {duration}")
     
-    return " | ".join(summary_parts)
\ No newline at end of file
+    return " | ".join(summary_parts)
+
+# Dropdown options are admin-managed reference data; cache each category's active options
+_DROPDOWN_CACHE_TTL = 3600
+
+def _dropdown_cache_key(category):
+    return f"dropdown:{category}"
+
+def get_dropdown_choices(category):
+    """
+    Return the active DropdownConfiguration options for a category (cached)
+    """
+    return get_dropdown_choices_many([category])[category]
+
+def get_dropdown_choices_many(categories):
+    """
+    Return {category: [options]} for several categories; cache misses are
+    loaded together in a single query and grouped in Python
+    """
+    keys = {_dropdown_cache_key(category): category for category in categories}
+    cached = cache.get_many(keys)
+    choices = {keys[key]: options for key, options in cached.items()}
+    
+    missing = [category for category in categories if category not in choices]
+    if missing:
+        rows = DropdownConfiguration.objects.filter(
+            category__in=missing, is_active=True
+        ).order_by('category', 'sort_order', 'value')
+        loaded = {category: [] for category in missing}
+        loaded.update({
+            category: list(options)
+            for category, options in groupby(rows, key=lambda row: row.category)
+        })
+        cache.set_many(
+            {_dropdown_cache_key(category): options for category, options in loaded.items()},
+            _DROPDOWN_CACHE_TTL
+        )
+        choices.update(loaded)
+    
+    return choices
+
+def invalidate_dropdown_choices(category):
+    """Drop the cached options for a category (called when an option changes)"""
+    cache.delete(_dropdown_cache_key(category))
@@ -1,16 +1,32 @@
 from django.core.exceptions import ValidationError
 from django.utils import timezone
 from django.db import models
+from django.db.models import BooleanField, ExpressionWrapper, Q
 import ipaddress
-import re
+import socket
+import string
 from datetime import timedelta
 
+# Translation table deleting every allowed ASCII site-name character (letters, numbers,
+# whitespace, hyphens, underscores); whatever survives translate() is checked with isspace()
+# so non-ASCII whitespace stays accepted, matching the previous \s-based pattern
+_SITE_NAME_ALLOWED = str.maketrans('', '', string.ascii_letters + string.digits + string.whitespace + '-_')
+
 class IncidentValidators:
     """Custom validators for incident forms"""
     
     @staticmethod
     def validate_ip_address(ip_string):
         """Validate IP address format"""
+        # Fast path: libc parser handles plain IPv4/IPv6 addresses
+        for family in (socket.AF_INET, socket.AF_INET6):
+            try:
+                socket.inet_pton(family, ip_string)
+                return True
+            except (OSError, ValueError, TypeError):
+                pass
+        
+        # Fall back to ipaddress for forms inet_pton rejects (e.g. scoped IPv6)
         try:
             ipaddress.ip_address(ip_string)
             return True
@@ -66,10 +82,13 @@ class IncidentValidators:
                 "DOT Extremity B is required when Extremity B is provided"
             )
         
-        if extremity_a and extremity_b and extremity_a.strip().lower() == extremity_b.strip().lower():
-            raise ValidationError(
-                "Extremity A and Extremity B cannot be the same location"
-            )
+        if extremity_a and extremity_b:
+            a = extremity_a.strip().casefold()
+            b = extremity_b.strip().casefold()
+            if a == b:
+                raise ValidationError(
+                    "Extremity A and Extremity B cannot be the same location"
+                )
     
     @staticmethod
     def validate_site_name(site_name, network_type):
@@ -80,18 +99,21 @@ class IncidentValidators:
         # Remove extra whitespace
         site_name = site_name.strip()
         
-        if len(site_name) < 2:
+        length = len(site_name)
+        
+        if length < 2:
             raise ValidationError(
                 "Site name must be at least 2 characters long"
             )
         
-        if len(site_name) > 50:
+        if length > 50:
             raise ValidationError(
                 "Site name cannot exceed 50 characters"
             )
         
         # Check for valid characters (alphanumeric, spaces, hyphens, underscores)
-        if not re.match(r'^[a-zA-Z0-9\s\-_]+$', site_name):
+        leftover = site_name.translate(_SITE_NAME_ALLOWED)
+        if leftover and not leftover.isspace():
             raise ValidationError(
                 "Site name can only contain letters, numbers, spaces, hyphens, and underscores"
             )
@@ -119,7 +141,7 @@ class DuplicateIncidentChecker:
         if exclude_id:
             query = query.exclude(id=exclude_id)
         
-        if query.exists():
+        if query.values('pk').exists():
             raise ValidationError(
                 f"A similar incident for {extremity_a} to {extremity_b} already exists within the last hour"
             )
@@ -140,7 +162,7 @@ class DuplicateIncidentChecker:
         if exclude_id:
             query = query.exclude(id=exclude_id)
         
-        if query.exists():
+        if query.values('pk').exists():
             raise ValidationError(
                 f"A similar incident for IP {ip_address} already exists within the last 2 hours"
             )
@@ -161,7 +183,67 @@ class DuplicateIncidentChecker:
         if exclude_id:
             query = query.exclude(id=exclude_id)
         
-        if query.exists():
+        if query.values('pk').exists():
             raise ValidationError(
                 f"A similar incident for site '{site}' already exists within the last hour"
-            )
\ No newline at end of file
+            )
+    
+    @staticmethod
+    def check_all(model_class, *, incident_time, ip=None, site=None,
+                  extremity_a=None, extremity_b=None, exclude_id=None):
+        """
+        Run the IP, site and extremity duplicate checks in a single query.
+        Each check is only included when its fields are provided; every
+        matching check contributes its message to the raised ValidationError.
+        """
+        one_hour = timedelta(hours=1)
+        two_hours = timedelta(hours=2)
+        
+        # (annotation name, Q clause, error message) for each requested check
+        checks = []
+        if ip:
+            checks.append((
+                'dup_ip',
+                Q(ip_address=ip,
+                  date_time_incident__gte=incident_time - two_hours,
+                  date_time_incident__lte=incident_time + two_hours),
+                f"A similar incident for IP {ip} already exists within the last 2 hours"
+            ))
+        if site:
+            checks.append((
+                'dup_site',
+                Q(site__iexact=site,
+                  date_time_incident__gte=incident_time - one_hour,
+                  date_time_incident__lte=incident_time + one_hour),
+                f"A similar incident for site '{site}' already exists within the last hour"
+            ))
+        if extremity_a and extremity_b:
+            checks.append((
+                'dup_extremity',
+                Q(extremity_a__iexact=extremity_a,
+                  extremity_b__iexact=extremity_b,
+                  date_time_incident__gte=incident_time - one_hour,
+                  date_time_incident__lte=incident_time + one_hour),
+                f"A similar incident for {extremity_a} to {extremity_b} already exists within the last hour"
+            ))
+        
+        if not checks:
+            return
+        
+        combined = Q()
+        for _name, clause, _message in checks:
+            combined |= clause
+        
+        query = model_class.objects.filter(combined, date_time_recovery__isnull=True)
+        
+        if exclude_id:
+            query = query.exclude(id=exclude_id)
+        
+        # Flag which clause(s) the first hit matched so the error names the right dimension
+        hit = query.annotate(**{
+            name: ExpressionWrapper(clause, output_field=BooleanField())
+            for name, clause, _message in checks
+        }).values(*[name for name, _clause, _message in checks]).first()
+        
+        if hit:
+            raise ValidationError([message for name, _clause, message in checks if hit[name]])
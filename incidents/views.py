@@ -1,28 +1,44 @@
+from functools import partial, wraps
 from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib.auth.decorators import login_required
 from django.contrib import messages
 from django.urls import reverse
-from django.http import JsonResponse
+from django.http import JsonResponse, FileResponse, StreamingHttpResponse
 from django.template.loader import render_to_string
 from django.views.decorators.http import require_http_methods
 from django.core.paginator import Paginator, EmptyPage, InvalidPage
 from django.utils import timezone
-from django.db.models import Q
-from datetime import timedelta
-from .services import get_search_service
+from django.core.cache import cache
+from django.db import DatabaseError, transaction
+from django.db.models import Q, Count, Value, CharField
+from datetime import datetime, time, timedelta
+from typing import NamedTuple
+from .services import get_search_service, get_export_service
+from .pagination import DeferredJoinPaginator, LitePaginator, UnionPaginator
+from .tasks import queue_audit_log
 from .forms import get_search_form_class
 from .models import (
     TransportNetworkIncident, FileAccessNetworkIncident, 
     RadioAccessNetworkIncident, CoreNetworkIncident, 
-    BackboneInternetNetworkIncident, DropdownConfiguration
+    BackboneInternetNetworkIncident, DropdownConfiguration, AuditLog, SavedSearch,
+    ARCHIVE_DELAY, summarize_search_params
 )
 from .forms import (
     TransportNetworkIncidentForm, FileAccessNetworkIncidentForm,
     RadioAccessNetworkIncidentForm, CoreNetworkIncidentForm,
     BackboneInternetNetworkIncidentForm, get_incident_form_class, update_form_common_fields
 )
-from .utils import get_incident_color_class
+from .utils import (
+    get_dropdown_choices_many, get_list_count_cache_key,
+    get_archive_cache_key, invalidate_network_statistics
+)
+import io
 import json
+import re
+import orjson
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font, PatternFill
 
 def format_datetime_for_input(dt):
     """
@@ -39,82 +55,123 @@ def format_datetime_for_input(dt):
     # Format as HTML5 datetime-local expects: YYYY-MM-DDTHH:MM
     return dt.strftime('%Y-%m-%dT%H:%M')
 
+class NetworkConfig(NamedTuple):
+    """Per-network view configuration: display name, model, form and list template"""
+    name: str
+    model: type
+    form: type
+    template: str
+
 # Fixed Network configuration - corrected backbone_internet naming
 NETWORKS = {
-    'transport': {
-        'name': 'Transport Networks',
-        'model': TransportNetworkIncident,
-        'form': TransportNetworkIncidentForm,
-        'template': 'incidents/transport_networks.html'
-    },
-    'file_access': {
-        'name': 'File Access Networks',
-        'model': FileAccessNetworkIncident,
-        'form': FileAccessNetworkIncidentForm,
-        'template': 'incidents/file_access_networks.html'
-    },
-    'radio_access': {
-        'name': 'Radio Access Networks',
-        'model': RadioAccessNetworkIncident,
-        'form': RadioAccessNetworkIncidentForm,
-        'template': 'incidents/radio_access_networks.html'
-    },
-    'core': {
-        'name': 'Core Networks',
-        'model': CoreNetworkIncident,
-        'form': CoreNetworkIncidentForm,
-        'template': 'incidents/core_networks.html'
-    },
-    'backbone_internet': {  # Fixed: was missing _internet
-        'name': 'Backbone Internet Networks',
-        'model': BackboneInternetNetworkIncident,
-        'form': BackboneInternetNetworkIncidentForm,
-        'template': 'incidents/backbone_internet_networks.html'
-    }
+    'transport': NetworkConfig(
+        'Transport Networks', TransportNetworkIncident, TransportNetworkIncidentForm,
+        'incidents/transport_networks.html'
+    ),
+    'file_access': NetworkConfig(
+        'File Access Networks', FileAccessNetworkIncident, FileAccessNetworkIncidentForm,
+        'incidents/file_access_networks.html'
+    ),
+    'radio_access': NetworkConfig(
+        'Radio Access Networks', RadioAccessNetworkIncident, RadioAccessNetworkIncidentForm,
+        'incidents/radio_access_networks.html'
+    ),
+    'core': NetworkConfig(
+        'Core Networks', CoreNetworkIncident, CoreNetworkIncidentForm,
+        'incidents/core_networks.html'
+    ),
+    'backbone_internet': NetworkConfig(  # Fixed: was missing _internet
+        'Backbone Internet Networks', BackboneInternetNetworkIncident,
+        BackboneInternetNetworkIncidentForm, 'incidents/backbone_internet_networks.html'
+    ),
 }
 
+# List URL names derived from NETWORKS once at import
+REDIRECT_URLS = {key: f'incidents:{key}_incidents' for key in NETWORKS}
+
+def requires_valid_network(view_func):
+    """
+    Validate the network_type URL argument once: unknown types redirect to the
+    dashboard with an error, valid ones expose their config as request.network_config
+    """
+    @wraps(view_func)
+    def wrapper(request, network_type, *args, **kwargs):
+        network_config = NETWORKS.get(network_type)
+        if network_config is None:
+            messages.error(request, f"Invalid network type: {network_type}")
+            return redirect('dashboard:dashboard')
+        request.network_config = network_config
+        return view_func(request, network_type, *args, **kwargs)
+    return wrapper
+
+# Search text that could be (the start of) an incident UUID
+UUID_PREFIX_RE = re.compile(r'^[0-9a-fA-F-]+$')
+
+# Query parameters of the list views that are not search filters
+LIST_PAGING_PARAMS = frozenset(('page', 'size'))
+
 @login_required
+@requires_valid_network
 def network_incidents_view(request, network_type):
     """Enhanced view with advanced pagination for large datasets"""
-    if network_type not in NETWORKS:
-        messages.error(request, f"Invalid network type: {network_type}")
-        return redirect('dashboard:dashboard')
-    
-    network_config = NETWORKS[network_type]
-    model = network_config['model']
+    network_config = request.network_config
+    model = network_config.model
     
     try:
         # Get search service and form
         search_service = get_search_service(network_type)
         search_form_class = get_search_form_class(network_type)
-        search_form = search_form_class(request.GET) if search_form_class else None
+        # Only bind (and validate) the search form when the request carries filter parameters
+        has_filters = any(key not in LIST_PAGING_PARAMS for key in request.GET)
+        if not search_form_class:
+            search_form = None
+        elif has_filters:
+            search_form = search_form_class(request.GET)
+        else:
+            search_form = search_form_class()
         
         # OPTIMIZED: Use select_related and only() for memory efficiency
-        base_queryset = model.objects.filter(is_archived=False).select_related('created_by', 'updated_by').only(
-            'id', 'date_time_incident', 'date_time_recovery', 'duration_minutes',
-            'cause', 'origin', 'is_resolved', 'created_by__username', 'updated_by__username',
-            # Network-specific essential fields
-            *get_essential_fields_for_network(network_type)
+        # The list templates never show the creator/updater, so no user joins are needed
+        base_queryset = model.objects.filter(is_archived=False).only(
+            *LIST_ONLY_FIELDS[network_type]
         )
         
         # Apply search filters
         filtered_queryset = base_queryset
-        search_active = bool(False)
+        search_active = False
         
-        if search_form and search_form.is_valid():
+        if has_filters and search_form and search_form.is_valid():
             form_data = search_form.cleaned_data
-            search_active = any(value for value in form_data.values() if value)
+            search_active = any(form_data.values())
             
             if search_active:
-                filtered_queryset = search_service.search_incidents(form_data)
+                # Search matches impact_comment in SQL, but the list never renders it (or
+                # the users the search service joins), so results stay as narrow as the base list
+                filtered_queryset = search_service.search_incidents(form_data).select_related(None).only(
+                    *LIST_ONLY_FIELDS[network_type]
+                )
             else:
                 filtered_queryset = base_queryset.order_by('-date_time_incident')
         else:
             filtered_queryset = base_queryset.order_by('-date_time_incident')
         
+        # OPTIMIZED: Counts and severity buckets in one aggregate, cached briefly per filter set
+        stats_cache_key = get_list_count_cache_key(network_type, form_data if search_active else None)
+        search_stats = cache.get(stats_cache_key)
+        if search_stats is None:
+            search_stats = search_service.get_optimized_statistics(base_queryset, filtered_queryset, search_active)
+            cache.set(stats_cache_key, search_stats, 60)
+        
+        # Listed rows carry their severity level from SQL, so the template's
+        # severity_class lookups don't recompute each incident's age
+        listed_queryset = model.with_severity(filtered_queryset, timezone.now())
+        
         # ENHANCED: Dynamic page size with memory limits
-        page_size = min(int(request.GET.get('size', 25)), 100)  # Max 100 per page
-        paginator = Paginator(filtered_queryset, page_size)
+        try:
+            page_size = min(max(int(request.GET.get('size', 25)), 1), 100)  # 1 to 100 per page
+        except ValueError:
+            page_size = 25
+        paginator = DeferredJoinPaginator(listed_queryset, page_size, count=search_stats['filtered_incidents'])
         page_number = request.GET.get('page', 1)
         
         try:
@@ -122,59 +179,38 @@ def network_incidents_view(request, network_type):
         except (EmptyPage, InvalidPage):
             incidents = paginator.page(1)
         
-        # OPTIMIZED: Get statistics with efficient queries
-        search_stats = search_service.get_optimized_statistics(base_queryset, filtered_queryset)
-        
         # MEMORY OPTIMIZED: Limit recent resolved to prevent memory issues
-        recent_resolved_qs = filtered_queryset.filter(
-            is_archived=False,
+        recent_resolved = listed_queryset.filter(
             date_time_recovery__isnull=False,
             date_time_recovery__gte=timezone.now() - timedelta(hours=24)
         ).order_by('-date_time_recovery')[:10]
         
-        # MEMORY OPTIMIZED: Get active incidents with limits
-        active_incidents_qs = filtered_queryset.filter(
-            is_archived=False,
+        active_incidents = listed_queryset.filter(
             date_time_recovery__isnull=True
         ).order_by('-date_time_incident')
         
-        # Calculate severity counts efficiently
-        active_incidents_list = list(active_incidents_qs[:100])  # Limit to first 100 for stats
-        severity_counts = {'new': 0, 'low': 0, 'medium': 0, 'critical': 0}
-
-        for incident in active_incidents_list:
-            severity = incident.get_severity_class()
-            if severity == 'incident-new':
-                severity_counts['new'] += 1
-            elif severity == 'incident-low':
-                severity_counts['low'] += 1
-            elif severity == 'incident-medium':
-                severity_counts['medium'] += 1
-            elif severity == 'incident-critical':
-                severity_counts['critical'] += 1
-        
         context = {
             'network_type': network_type,
-            'network_name': network_config['name'],
+            'network_name': network_config.name,
             'incidents': incidents,
             'search_form': search_form,
             'search_active': search_active,
             'search_stats': search_stats,
             'total_incidents': search_stats['total_incidents'],
-            'active_incidents': active_incidents_qs,
+            'active_incidents': active_incidents,
             'resolved_incidents': search_stats['resolved_incidents'],
-            'resolved_recent': recent_resolved_qs,
-            'severity_counts': severity_counts,
+            'resolved_recent': recent_resolved,
+            'severity_counts': search_stats['severity_counts'],
             'page_obj': incidents,  # For pagination template
         }
         
-        return render(request, network_config['template'], context)
+        return render(request, network_config.template, context)
         
-    except Exception as e:
+    except DatabaseError as e:
         messages.error(request, f"Error loading incidents: {str(e)}")
-        return render(request, network_config['template'], {
+        return render(request, network_config.template, {
             'network_type': network_type,
-            'network_name': network_config['name'],
+            'network_name': network_config.name,
             'incidents': [],
             'search_form': None,
             'search_active': False,
@@ -186,87 +222,137 @@ def network_incidents_view(request, network_type):
             'error': str(e)
         })
 
-# NEW: Helper function for memory optimization
+@login_required
+@require_http_methods(["GET"])
+@requires_valid_network
+def severity_counts_view(request, network_type):
+    """
+    Severity counts of a network's listed active incidents as JSON, so list pages
+    can refresh their severity cards without reloading (served from the cached
+    unfiltered list statistics)
+    """
+    stats_cache_key = get_list_count_cache_key(network_type)
+    stats = cache.get(stats_cache_key)
+    if stats is None:
+        base_queryset = request.network_config.model.objects.filter(is_archived=False)
+        stats = get_search_service(network_type).get_optimized_statistics(
+            base_queryset, base_queryset, search_active=False
+        )
+        cache.set(stats_cache_key, stats, 60)
+    
+    return JsonResponse({'severity_counts': stats['severity_counts']})
+
+# NEW: Essential fields per network type, used to narrow list queries with only()
+ESSENTIAL_FIELDS = {
+    'transport': ('region_loop', 'system_capacity', 'extremity_a', 'extremity_b'),
+    'file_access': ('do_wilaya', 'zone_metro', 'site', 'ip_address'),
+    'radio_access': ('do_wilaya', 'site', 'ip_address'),
+    'core': ('platform', 'region_node', 'site', 'extremity_a', 'extremity_b'),
+    'backbone_internet': ('interconnect_type', 'platform_igw', 'link_label'),
+}
+
 def get_essential_fields_for_network(network_type):
     """Return essential fields for each network type to optimize queries"""
-    field_map = {
-        'transport': ['region_loop', 'system_capacity', 'extremity_a', 'extremity_b'],
-        'file_access': ['do_wilaya', 'zone_metro', 'site', 'ip_address'],
-        'radio_access': ['do_wilaya', 'site', 'ip_address'],
-        'core': ['platform', 'region_node', 'site', 'extremity_a', 'extremity_b'],
-        'backbone_internet': ['interconnect_type', 'platform_igw', 'link_label'],
-    }
-    return field_map.get(network_type, [])
+    return ESSENTIAL_FIELDS.get(network_type, ())
+
+# Complete only() field lists for the network list view, assembled once per network
+LIST_ONLY_FIELDS = {
+    key: (
+        'id', 'date_time_incident', 'date_time_recovery', 'duration_minutes',
+        'cause', 'origin', 'is_resolved', 'is_archived',
+        *fields
+    )
+    for key, fields in ESSENTIAL_FIELDS.items()
+}
+
+# Template context key -> DropdownConfiguration category, per network
+COMMON_DROPDOWNS = {
+    'cause_choices': 'cause',
+    'origin_choices': 'origin',
+}
+
+NETWORK_DROPDOWNS = {
+    'transport': {
+        'region_choices': 'region_loop',
+        'system_choices': 'system_capacity',
+        'dot_choices': 'dot_states',
+    },
+    'file_access': {
+        'wilaya_choices': 'wilayas',
+    },
+    'radio_access': {
+        'wilaya_choices': 'wilayas',
+    },
+    'core': {
+        'platform_choices': 'platforms',
+        'region_node_choices': 'region_nodes',
+        'dot_choices': 'dot_states',
+    },
+    'backbone_internet': {
+        'interconnect_choices': 'interconnect_types',
+        'platform_igw_choices': 'platform_igws',
+    },
+}
+
+# Fields copied from the incident into the edit form's initial data, per network
+COMMON_INITIAL_FIELDS = ('cause', 'origin', 'impact_comment')
+
+NETWORK_INITIAL_FIELDS = {
+    'transport': (
+        'region_loop', 'system_capacity', 'dot_extremity_a', 'extremity_a',
+        'dot_extremity_b', 'extremity_b', 'responsibility',
+    ),
+    'file_access': ('do_wilaya', 'zone_metro', 'site', 'ip_address'),
+    'radio_access': ('do_wilaya', 'site', 'ip_address'),
+    'core': (
+        'platform', 'region_node', 'site', 'dot_extremity_a', 'extremity_a',
+        'dot_extremity_b', 'extremity_b',
+    ),
+    'backbone_internet': ('interconnect_type', 'platform_igw', 'link_label'),
+}
+
+def get_dropdown_context(network_type):
+    """
+    Build the dropdown choice lists for the incident form of a network type,
+    fetching every category it needs in one (cached) lookup
+    """
+    dropdowns = {**COMMON_DROPDOWNS, **NETWORK_DROPDOWNS.get(network_type, {})}
+    choices = get_dropdown_choices_many(list(dropdowns.values()))
+    return {key: choices[category] for key, category in dropdowns.items()}
+
+def add_form_error_messages(request, form, use_field_labels=False):
+    """
+    Queue one error message per form error, prefixed with the field's label
+    (non-field errors are shown as-is)
+    """
+    for field, errors in form.errors.items():
+        if field == '__all__':
+            prefix = ''
+        else:
+            form_field = form.fields.get(field) if use_field_labels else None
+            label = (form_field.label if form_field else None) or field.replace('_', ' ').title()
+            prefix = f"{label}: "
+        for error in errors:
+            messages.error(request, f"{prefix}{error}")
 
 @login_required
+@requires_valid_network
 @require_http_methods(["GET", "POST"])
 def add_incident_view(request, network_type):
     """Enhanced view to add new incidents with form data preservation"""
-    
-    # Validate network type first
-    if network_type not in NETWORKS:
-        messages.error(request, f"Invalid network type: {network_type}")
-        return redirect('dashboard:dashboard')
-    
-    # Get dropdown data directly from database
-    from .models import DropdownConfiguration
+    network_config = request.network_config
     
     # Initialize form data with POST data if available, empty dict otherwise
     form_data = request.POST if request.method == 'POST' else {}
     
     context = {
-        'network_type': NETWORKS[network_type]['name'],
+        'network_type': network_config.name,
         'action': 'Add New',
         'form_data': form_data,  # Pass form data to template
-        # Common dropdown choices for all networks
-        'cause_choices': DropdownConfiguration.objects.filter(
-            category='cause', is_active=True
-        ).order_by('sort_order', 'value'),
-        'origin_choices': DropdownConfiguration.objects.filter(
-            category='origin', is_active=True
-        ).order_by('sort_order', 'value'),
     }
     
-    # Add network-specific choices
-    if network_type == 'transport':
-        context.update({
-            'region_choices': DropdownConfiguration.objects.filter(
-                category='region_loop', is_active=True
-            ).order_by('sort_order', 'value'),
-            'system_choices': DropdownConfiguration.objects.filter(
-                category='system_capacity', is_active=True
-            ).order_by('sort_order', 'value'),
-            'dot_choices': DropdownConfiguration.objects.filter(
-                category='dot_states', is_active=True
-            ).order_by('sort_order', 'value'),
-        })
-    elif network_type in ['file_access', 'radio_access']:
-        context.update({
-            'wilaya_choices': DropdownConfiguration.objects.filter(
-                category='wilayas', is_active=True
-            ).order_by('sort_order', 'value'),
-        })
-    elif network_type == 'core':
-        context.update({
-            'platform_choices': DropdownConfiguration.objects.filter(
-                category='platforms', is_active=True
-            ).order_by('sort_order', 'value'),
-            'region_node_choices': DropdownConfiguration.objects.filter(
-                category='region_nodes', is_active=True
-            ).order_by('sort_order', 'value'),
-            'dot_choices': DropdownConfiguration.objects.filter(
-                category='dot_states', is_active=True
-            ).order_by('sort_order', 'value'),
-        })
-    elif network_type == 'backbone_internet':
-        context.update({
-            'interconnect_choices': DropdownConfiguration.objects.filter(
-                category='interconnect_types', is_active=True
-            ).order_by('sort_order', 'value'),
-            'platform_igw_choices': DropdownConfiguration.objects.filter(
-                category='platform_igws', is_active=True
-            ).order_by('sort_order', 'value'),
-        })
+    # Common and network-specific dropdown choices
+    context.update(get_dropdown_context(network_type))
     
     if request.method == 'POST':
         try:
@@ -281,30 +367,16 @@ def add_incident_view(request, network_type):
                 
                 messages.success(
                     request, 
-                    f"Incident {str(incident.id)[:8]} created successfully for {NETWORKS[network_type]['name']}"
+                    f"Incident {str(incident.id)[:8]} created successfully for {network_config.name}"
                 )
                 
                 # Redirect to the appropriate network incidents list
-                redirect_urls = {
-                    'transport': 'incidents:transport_incidents',
-                    'file_access': 'incidents:file_access_incidents',
-                    'radio_access': 'incidents:radio_access_incidents',
-                    'core': 'incidents:core_incidents',
-                    'backbone_internet': 'incidents:backbone_internet_incidents'
-                }
-                
-                redirect_url = redirect_urls.get(network_type, 'dashboard:dashboard')
+                redirect_url = REDIRECT_URLS.get(network_type, 'dashboard:dashboard')
                 return redirect(redirect_url)
                 
             else:
                 # Handle form errors but preserve data
-                for field, errors in form.errors.items():
-                    for error in errors:
-                        if field == '__all__':
-                            messages.error(request, error)
-                        else:
-                            field_label = field.replace('_', ' ').title()
-                            messages.error(request, f"{field_label}: {error}")
+                add_form_error_messages(request, form)
                 
                 # Form data is already in context, template will preserve it
                 
@@ -314,74 +386,23 @@ def add_incident_view(request, network_type):
     return render(request, 'incidents/incident_form.html', context)
 
 @login_required
+@requires_valid_network
 @require_http_methods(["GET", "POST"])
 def edit_incident_view(request, network_type, incident_id):
     """Enhanced view to edit existing incidents with validation"""
-    if network_type not in NETWORKS:
-        messages.error(request, f"Invalid network type: {network_type}")
-        return redirect('dashboard:dashboard')
-    
-    network_config = NETWORKS[network_type]
-    model = network_config['model']
-    form_class = network_config['form']
+    network_config = request.network_config
+    model = network_config.model
+    form_class = network_config.form
     
     try:
         incident = get_object_or_404(model, id=incident_id)
-
-        from .models import DropdownConfiguration
-        
-        dropdown_context = {
-            'cause_choices': list(DropdownConfiguration.objects.filter(
-                category='cause', is_active=True
-            ).order_by('sort_order', 'value')),
-            'origin_choices': list(DropdownConfiguration.objects.filter(
-                category='origin', is_active=True
-            ).order_by('sort_order', 'value')),
-        }
         
-        # Add network-specific dropdown choices
-        if network_type == 'transport':
-            dropdown_context.update({
-                'region_choices': list(DropdownConfiguration.objects.filter(
-                    category='region_loop', is_active=True
-                ).order_by('sort_order', 'value')),
-                'system_choices': list(DropdownConfiguration.objects.filter(
-                    category='system_capacity', is_active=True
-                ).order_by('sort_order', 'value')),
-                'dot_choices': list(DropdownConfiguration.objects.filter(
-                    category='dot_states', is_active=True
-                ).order_by('sort_order', 'value')),
-            })
-        elif network_type in ['file_access', 'radio_access']:
-            dropdown_context['wilaya_choices'] = list(DropdownConfiguration.objects.filter(
-                category='wilayas', is_active=True
-            ).order_by('sort_order', 'value'))
-        elif network_type == 'core':
-            dropdown_context.update({
-                'platform_choices': list(DropdownConfiguration.objects.filter(
-                    category='platforms', is_active=True
-                ).order_by('sort_order', 'value')),
-                'region_node_choices': list(DropdownConfiguration.objects.filter(
-                    category='region_nodes', is_active=True
-                ).order_by('sort_order', 'value')),
-                'dot_choices': list(DropdownConfiguration.objects.filter(
-                    category='dot_states', is_active=True
-                ).order_by('sort_order', 'value')),
-            })
-        elif network_type == 'backbone_internet':
-            dropdown_context.update({
-                'interconnect_choices': list(DropdownConfiguration.objects.filter(
-                    category='interconnect_types', is_active=True
-                ).order_by('sort_order', 'value')),
-                'platform_igw_choices': list(DropdownConfiguration.objects.filter(
-                    category='platform_igws', is_active=True
-                ).order_by('sort_order', 'value')),
-            })
+        dropdown_context = get_dropdown_context(network_type)
         
         # Check if user can edit this incident
         if not request.user.is_admin() and incident.created_by != request.user:
             messages.error(request, "You can only edit incidents you created.")
-            return redirect(f'incidents:{network_type}_incidents')
+            return redirect(REDIRECT_URLS[network_type])
         
         if request.method == 'POST':
             form = form_class(request.POST, instance=incident, user=request.user)
@@ -398,16 +419,10 @@ def edit_incident_view(request, network_type, incident_id):
                     f"Incident {str(incident.id)[:8]} updated successfully"
                 )
                 
-                return redirect(f'incidents:{network_type}_incidents')
+                return redirect(REDIRECT_URLS[network_type])
             else:
                 # Collect and display form errors
-                for field, errors in form.errors.items():
-                    for error in errors:
-                        if field == '__all__':
-                            messages.error(request, error)
-                        else:
-                            field_label = form.fields.get(field, {}).label or field.replace('_', ' ').title()
-                            messages.error(request, f"{field_label}: {error}")
+                add_form_error_messages(request, form, use_field_labels=True)
         else:
             # GET request - Prepare initial data with properly formatted datetime
             initial_data = {}
@@ -418,53 +433,9 @@ def edit_incident_view(request, network_type, incident_id):
             if incident.date_time_recovery:
                 initial_data['date_time_recovery'] = format_datetime_for_input(incident.date_time_recovery)
             
-            # Add all other fields based on network type
-            if network_type == 'transport':
-                initial_data.update({
-                    'region_loop': incident.region_loop,
-                    'system_capacity': incident.system_capacity,
-                    'dot_extremity_a': incident.dot_extremity_a,
-                    'extremity_a': incident.extremity_a,
-                    'dot_extremity_b': incident.dot_extremity_b,
-                    'extremity_b': incident.extremity_b,
-                    'responsibility': incident.responsibility,
-                })
-            elif network_type == 'file_access':
-                initial_data.update({
-                    'do_wilaya': incident.do_wilaya,
-                    'zone_metro': incident.zone_metro,
-                    'site': incident.site,
-                    'ip_address': incident.ip_address,
-                })
-            elif network_type == 'radio_access':
-                initial_data.update({
-                    'do_wilaya': incident.do_wilaya,
-                    'site': incident.site,
-                    'ip_address': incident.ip_address,
-                })
-            elif network_type == 'core':
-                initial_data.update({
-                    'platform': incident.platform,
-                    'region_node': incident.region_node,
-                    'site': incident.site,
-                    'dot_extremity_a': incident.dot_extremity_a,
-                    'extremity_a': incident.extremity_a,
-                    'dot_extremity_b': incident.dot_extremity_b,
-                    'extremity_b': incident.extremity_b,
-                })
-            elif network_type == 'backbone_internet':
-                initial_data.update({
-                    'interconnect_type': incident.interconnect_type,
-                    'platform_igw': incident.platform_igw,
-                    'link_label': incident.link_label,
-                })
-            
-            # Common fields for all networks
-            initial_data.update({
-                'cause': incident.cause,
-                'origin': incident.origin,
-                'impact_comment': incident.impact_comment,
-            })
+            # Network-specific fields, then the fields common to all networks
+            for field in (*NETWORK_INITIAL_FIELDS[network_type], *COMMON_INITIAL_FIELDS):
+                initial_data[field] = getattr(incident, field)
             
             # Create form with initial data AND instance
             form = form_class(initial=initial_data, instance=incident, user=request.user)
@@ -473,8 +444,8 @@ def edit_incident_view(request, network_type, incident_id):
         context = {
             'form': form,
             'incident': incident,
-            'network_type': network_config['name'],
-            'form_title': f'Edit {network_config["name"]} Incident',
+            'network_type': network_config.name,
+            'form_title': f'Edit {network_config.name} Incident',
             'submit_text': 'Update Incident',
             'cancel_url': reverse(f'incidents:{network_type}_incidents'),
             'is_edit': True,
@@ -486,7 +457,7 @@ def edit_incident_view(request, network_type, incident_id):
         
     except Exception as e:
         messages.error(request, f"Error editing incident: {str(e)}")
-        return redirect(f'incidents:{network_type}_incidents')
+        return redirect(REDIRECT_URLS[network_type])
     
 
 @login_required
@@ -496,7 +467,7 @@ def incident_notification_prompt(request, network_type, incident_id):
         return redirect('dashboard:dashboard')
     
     network_config = NETWORKS[network_type]
-    model = network_config['model']
+    model = network_config.model
     
     try:
         incident = get_object_or_404(model, id=incident_id)
@@ -504,57 +475,50 @@ def incident_notification_prompt(request, network_type, incident_id):
         context = {
             'incident': incident,
             'network_type': network_type,
-            'network_name': network_config['name'],
+            'network_name': network_config.name,
         }
         
         return render(request, 'incidents/notification_prompt.html', context)
         
     except Exception as e:
         messages.error(request, f"Error loading notification prompt: {str(e)}")
-        return redirect(f'incidents:{network_type}_incidents')
+        return redirect(REDIRECT_URLS[network_type])
 
 @login_required
+@requires_valid_network
 def historical_incidents_view(request, network_type):
     """Enhanced view for historical incidents"""
-    if network_type not in NETWORKS:
-        messages.error(request, f"Invalid network type: {network_type}")
-        return redirect('dashboard:dashboard')
-    
-    network_config = NETWORKS[network_type]
-    model = network_config['model']
+    network_config = request.network_config
+    model = network_config.model
     
     try:
-        # Get resolved incidents (those with recovery time)
+        # Get resolved incidents (those with recovery time); the historical template
+        # never shows the creator/updater, so no user joins are needed
         incidents_queryset = model.objects.filter(
             date_time_recovery__isnull=False
-        ).select_related('created_by', 'updated_by').order_by('-date_time_recovery')
+        ).only(*LIST_ONLY_FIELDS[network_type]).order_by('-date_time_recovery', '-id')
         
-        # Pagination
-        paginator = Paginator(incidents_queryset, 25)  # 25 historical incidents per page
+        # Pagination: the page only links to previous/next, so skip COUNT(*); the id
+        # tiebreaker keeps the primary-key slices stable across pages
+        paginator = LitePaginator(incidents_queryset, 25)  # 25 historical incidents per page
         page_number = request.GET.get('page')
         incidents = paginator.get_page(page_number)
         
-        # Add color class (should all be green for resolved)
-        for incident in incidents:
-            incident.color_class = get_incident_color_class(incident)
-        
         context = {
             'network_type': network_type,
-            'network_name': network_config['name'],
+            'network_name': network_config.name,
             'incidents': incidents,
-            'total_resolved': incidents_queryset.count(),
             'page_obj': incidents,
         }
         
         return render(request, 'incidents/historical_incidents.html', context)
         
-    except Exception as e:
+    except DatabaseError as e:
         messages.error(request, f"Error loading historical incidents: {str(e)}")
         return render(request, 'incidents/historical_incidents.html', {
             'network_type': network_type,
-            'network_name': network_config['name'],
+            'network_name': network_config.name,
             'incidents': [],
-            'total_resolved': 0,
             'error': str(e)
         })
 
@@ -570,7 +534,7 @@ def validate_incident_field(request, network_type):
     incident_id = request.POST.get('incident_id')  # For edit validation
     
     try:
-        form_class = NETWORKS[network_type]['form']
+        form_class = NETWORKS[network_type].form
         
         # Create a temporary form instance for validation
         form_data = {field_name: field_value}
@@ -604,22 +568,27 @@ def ajax_search_incidents(request, network_type):
         return JsonResponse({'suggestions': []})
     
     try:
-        search_service = get_search_service(network_type)
-        model = NETWORKS[network_type]['model']
+        model = NETWORKS[network_type].model
         
-        # Quick search for suggestions
-        queryset = model.objects.filter(
-            Q(id__icontains=search_query) |
+        # Quick search for suggestions; ID matching is a prefix match on the stored
+        # hex (an index range scan) and only tried when the query could be an ID
+        text_filter = (
             Q(impact_comment__icontains=search_query) |
             Q(cause__icontains=search_query) |
             Q(origin__icontains=search_query)
-        ).select_related('created_by')[:5]  # Limit to 5 suggestions
+        )
+        id_prefix = search_query.replace('-', '')
+        if id_prefix and UUID_PREFIX_RE.match(search_query):
+            text_filter |= Q(id__istartswith=id_prefix)
+        
+        rows = model.objects.filter(text_filter).values_list('id', 'cause')[:5]  # Limit to 5 suggestions
         
         suggestions = []
-        for incident in queryset:
+        for incident_id, cause in rows:
+            incident_id = str(incident_id)
             suggestions.append({
-                'id': str(incident.id),
-                'text': f"ID: {str(incident.id)[:8]}... - {incident.cause or 'Unknown cause'}",
+                'id': incident_id,
+                'text': f"ID: {incident_id[:8]}... - {cause or 'Unknown cause'}",
                 'url': f"/incidents/{network_type}/"
             })
         
@@ -629,6 +598,21 @@ def ajax_search_incidents(request, network_type):
         return JsonResponse({'error': str(e)}, status=500)
     
 
+# Columns the detail modal templates render (users: what get_full_name/username read)
+DETAIL_USER_FIELDS = tuple(
+    f'{relation}__{field}'
+    for relation in ('created_by', 'updated_by')
+    for field in ('username', 'first_name', 'last_name')
+)
+DETAIL_FIELDS = {
+    key: (
+        'id', 'date_time_incident', 'date_time_recovery', 'duration_minutes',
+        'is_resolved', 'is_archived', 'created_at', 'updated_at',
+        *COMMON_INITIAL_FIELDS, *fields, *DETAIL_USER_FIELDS,
+    )
+    for key, fields in NETWORK_INITIAL_FIELDS.items()
+}
+
 @login_required
 def get_incident_detail(request, network_type, incident_id):
     """
@@ -636,35 +620,52 @@ def get_incident_detail(request, network_type, incident_id):
     Returns HTML content as JSON response.
     """
     try:
-        # Map network type to model
-        model_map = {
-            'transport': TransportNetworkIncident,
-            'file_access': FileAccessNetworkIncident,
-            'radio_access': RadioAccessNetworkIncident,
-            'core': CoreNetworkIncident,
-            'backbone_internet': BackboneInternetNetworkIncident,
-        }
-        
         # Validate network type
-        if network_type not in model_map:
+        if network_type not in NETWORKS:
             return JsonResponse({
                 'success': False,
                 'error': 'Invalid network type'
             }, status=400)
         
-        # Get the incident
-        model = model_map[network_type]
-        incident = model.objects.select_related('created_by', 'updated_by').get(id=incident_id)
-        
-        # Prepare context data
-        context = {
-            'incident': incident,
-            'network_type': network_type,
-        }
-        
-        # CORRECTED PATH: Use incident_management/templates/incidents/detail_sections/
-        template_name = f'incidents/detail_sections/{network_type}_detail.html'
-        html_content = render_to_string(template_name, context, request=request)
+        # Get the incident version first; the fragment is cached per version, so an
+        # edit (including archiving) invalidates it. The archive button also depends
+        # on time: can_be_archived() turns true ARCHIVE_DELAY after recovery, so
+        # whether that delay has passed is part of the key as well
+        model = NETWORKS[network_type].model
+        updated_at, started_at, recovered_at = model.objects.values_list(
+            'updated_at', 'date_time_incident', 'date_time_recovery'
+        ).get(id=incident_id)
+        
+        now = timezone.now()
+        archive_delay_passed = bool(recovered_at) and now - recovered_at >= ARCHIVE_DELAY
+        cache_key = (
+            f'detail:{network_type}:{incident_id}:{updated_at.timestamp()}:'
+            f'{int(request.user.is_admin())}:{int(archive_delay_passed)}'
+        )
+        # The fragment also shows relative times (time_since, and the running duration
+        # of active incidents), so it is only kept while those labels would not change:
+        # 60s, like the list statistics, unless the incident is resolved and its
+        # "N days ago" label only moves by the day
+        long_lived = recovered_at and started_at and now - started_at >= timedelta(days=1)
+        cache_timeout = 3600 if long_lived else 60
+        html_content = cache.get(cache_key)
+        
+        if html_content is None:
+            incident = model.objects.with_users().only(
+                *DETAIL_FIELDS[network_type]
+            ).get(id=incident_id)
+            
+            # Prepare context data
+            context = {
+                'incident': incident,
+                'network_type': network_type,
+            }
+            
+            # CORRECTED PATH: Use incident_management/templates/incidents/detail_sections/
+            template_name = f'incidents/detail_sections/{network_type}_detail.html'
+            html_content = render_to_string(template_name, context, request=request)
+            
+            cache.set(cache_key, html_content, cache_timeout)
         
         # Return success response with HTML
         return JsonResponse({
@@ -680,14 +681,33 @@ def get_incident_detail(request, network_type, incident_id):
             'error': 'Incident not found'
         }, status=404)
         
-    except Exception as e:
+    except DatabaseError as e:
         return JsonResponse({
             'success': False,
             'error': str(e)
         }, status=500)
     
 
-    
+# Columns the unified archive page displays, filters or sorts on (plus per-network essentials);
+# duration_minutes and is_resolved are read by the duration_display filter
+ARCHIVED_LIST_FIELDS = (
+    'id', 'date_time_incident', 'date_time_recovery', 'duration_minutes', 'is_resolved',
+    'cause', 'origin', 'impact_comment', 'archived_at', 'archived_by__username',
+)
+ARCHIVED_ONLY_FIELDS = {
+    key: (*ARCHIVED_LIST_FIELDS, *fields) for key, fields in ESSENTIAL_FIELDS.items()
+}
+
+def union_querysets(querysets, all=False):
+    """
+    UNION the per-network querysets; when a single network is selected its
+    queryset is used directly (DISTINCT standing in for UNION's de-duplication)
+    """
+    first, *rest = querysets
+    if not rest:
+        return first if all else first.distinct()
+    return first.union(*rest, all=all)
+
 @login_required
 def unified_historical_incidents_view(request):
     """
@@ -695,55 +715,6 @@ def unified_historical_incidents_view(request):
     Shows archived incidents with filtering, search, and restore capabilities.
     """
     try:
-        # Get all archived incidents from all networks
-        transport_archived = TransportNetworkIncident.objects.filter(
-            is_archived=True
-        ).select_related('created_by', 'updated_by', 'archived_by')
-        
-        file_access_archived = FileAccessNetworkIncident.objects.filter(
-            is_archived=True
-        ).select_related('created_by', 'updated_by', 'archived_by')
-        
-        radio_access_archived = RadioAccessNetworkIncident.objects.filter(
-            is_archived=True
-        ).select_related('created_by', 'updated_by', 'archived_by')
-        
-        core_archived = CoreNetworkIncident.objects.filter(
-            is_archived=True
-        ).select_related('created_by', 'updated_by', 'archived_by')
-        
-        backbone_archived = BackboneInternetNetworkIncident.objects.filter(
-            is_archived=True
-        ).select_related('created_by', 'updated_by', 'archived_by')
-        
-        # Combine all querysets and add network_type attribute
-        all_archived = []
-        
-        for incident in transport_archived:
-            incident.network_type_key = 'transport'
-            incident.network_display_name = 'Transport Networks'
-            all_archived.append(incident)
-        
-        for incident in file_access_archived:
-            incident.network_type_key = 'file_access'
-            incident.network_display_name = 'File Access Networks'
-            all_archived.append(incident)
-        
-        for incident in radio_access_archived:
-            incident.network_type_key = 'radio_access'
-            incident.network_display_name = 'Radio Access Networks'
-            all_archived.append(incident)
-        
-        for incident in core_archived:
-            incident.network_type_key = 'core'
-            incident.network_display_name = 'Core Networks'
-            all_archived.append(incident)
-        
-        for incident in backbone_archived:
-            incident.network_type_key = 'backbone_internet'
-            incident.network_display_name = 'Backbone Internet Networks'
-            all_archived.append(incident)
-        
         # Apply filters from GET parameters
         network_filter = request.GET.get('network_type', '')
         cause_filter = request.GET.get('cause', '')
@@ -752,71 +723,112 @@ def unified_historical_incidents_view(request):
         date_to = request.GET.get('date_to', '')
         search_query = request.GET.get('search', '')
         
-        # Filter by network type
-        if network_filter:
-            all_archived = [inc for inc in all_archived if inc.network_type_key == network_filter]
+        # Build one filtered archived queryset per network; all filtering happens in SQL
+        archived_filter = Q(is_archived=True)
         
-        # Filter by cause
+        # Filter by cause / origin
         if cause_filter:
-            all_archived = [inc for inc in all_archived if inc.cause and cause_filter.lower() in inc.cause.lower()]
-        
-        # Filter by origin
+            archived_filter &= Q(cause__icontains=cause_filter)
         if origin_filter:
-            all_archived = [inc for inc in all_archived if inc.origin and origin_filter.lower() in inc.origin.lower()]
+            archived_filter &= Q(origin__icontains=origin_filter)
         
-        # Filter by date range
+        # Filter by archive date range
         if date_from:
             try:
-                from datetime import datetime
                 date_from_obj = datetime.strptime(date_from, '%Y-%m-%d')
                 date_from_aware = timezone.make_aware(date_from_obj) if timezone.is_naive(date_from_obj) else date_from_obj
-                all_archived = [inc for inc in all_archived if inc.archived_at and inc.archived_at >= date_from_aware]
+                archived_filter &= Q(archived_at__gte=date_from_aware)
             except ValueError:
                 pass
         
         if date_to:
             try:
-                from datetime import datetime, time
                 date_to_obj = datetime.strptime(date_to, '%Y-%m-%d')
                 # Set time to end of day
                 date_to_obj = datetime.combine(date_to_obj.date(), time.max)
                 date_to_aware = timezone.make_aware(date_to_obj) if timezone.is_naive(date_to_obj) else date_to_obj
-                all_archived = [inc for inc in all_archived if inc.archived_at and inc.archived_at <= date_to_aware]
+                archived_filter &= Q(archived_at__lte=date_to_aware)
             except ValueError:
                 pass
         
-        # Search filter
+        # Search filter (ID prefix or text match); UUIDs are stored as hex without hyphens,
+        # and the ID prefix is only tried when the query could be an ID
         if search_query:
-            search_lower = search_query.lower()
-            all_archived = [inc for inc in all_archived 
-                          if (str(inc.id).lower().startswith(search_lower) or
-                              (inc.impact_comment and search_lower in inc.impact_comment.lower()) or
-                              (inc.cause and search_lower in inc.cause.lower()) or
-                              (inc.origin and search_lower in inc.origin.lower()))]
-        
-        # Sort by archived_at (newest first)
-        all_archived.sort(key=lambda x: x.archived_at if x.archived_at else timezone.now(), reverse=True)
-        
-        # Calculate statistics by network
-        stats_by_network = {
-            'transport': len([i for i in all_archived if i.network_type_key == 'transport']),
-            'file_access': len([i for i in all_archived if i.network_type_key == 'file_access']),
-            'radio_access': len([i for i in all_archived if i.network_type_key == 'radio_access']),
-            'core': len([i for i in all_archived if i.network_type_key == 'core']),
-            'backbone_internet': len([i for i in all_archived if i.network_type_key == 'backbone_internet']),
+            search_filter = (
+                Q(impact_comment__icontains=search_query) |
+                Q(cause__icontains=search_query) |
+                Q(origin__icontains=search_query)
+            )
+            id_prefix = search_query.replace('-', '')
+            if id_prefix and UUID_PREFIX_RE.match(search_query):
+                search_filter |= Q(id__istartswith=id_prefix)
+            archived_filter &= search_filter
+        
+        archived_querysets = {
+            key: config.model.objects.filter(archived_filter)
+            for key, config in NETWORKS.items()
+            if not network_filter or key == network_filter
         }
         
-        # Get unique causes and origins for filter dropdowns
-        all_causes = set()
-        all_origins = set()
-        for incident in all_archived:
-            if incident.cause:
-                all_causes.add(incident.cause)
-            if incident.origin:
-                all_origins.add(incident.origin)
-        
-        # Pagination
-        paginator = Paginator(all_archived, 25)
+        # Narrow UNION ALL across networks, ordered by archived_at (newest first, id
+        # breaking ties so pages stay stable); the database sorts and paginates, only
+        # the page's rows are loaded in full.
+        # Each branch drops the models' default ordering so only the outer query sorts.
+        narrow = [
+            queryset.order_by().annotate(
+                network_type_key=Value(key, output_field=CharField())
+            ).values('id', 'archived_at', 'network_type_key')
+            for key, queryset in archived_querysets.items()
+        ]
+        if narrow:
+            all_archived = union_querysets(narrow, all=True).order_by('-archived_at', '-id')
+        else:
+            all_archived = TransportNetworkIncident.objects.none().values('id', 'archived_at')
+        
+        # Per-network counts and dropdown options only change when incidents do;
+        # cache them under the incident list versions and the current filters
+        def archive_summary():
+            # Calculate statistics by network: one COUNT per branch, sent as a single UNION ALL
+            stats_by_network = {key: 0 for key in NETWORKS}
+            count_queries = [
+                queryset.order_by().annotate(
+                    network_type_key=Value(key, output_field=CharField())
+                ).values('network_type_key').annotate(incident_count=Count('id'))
+                for key, queryset in archived_querysets.items()
+            ]
+            if count_queries:
+                for row in union_querysets(count_queries, all=True):
+                    stats_by_network[row['network_type_key']] = row['incident_count']
+            
+            # Get unique causes and origins for filter dropdowns; UNION (without ALL)
+            # de-duplicates across networks in the database
+            def distinct_values(field):
+                branches = [
+                    queryset.order_by().exclude(**{f'{field}__isnull': True}).exclude(**{field: ''})
+                    .values_list(field, flat=True)
+                    for queryset in archived_querysets.values()
+                ]
+                if not branches:
+                    return []
+                return list(union_querysets(branches).order_by(field))
+            
+            return stats_by_network, distinct_values('cause'), distinct_values('origin')
+        
+        summary_key = get_archive_cache_key({
+            'network_type': network_filter, 'cause': cause_filter, 'origin': origin_filter,
+            'date_from': date_from, 'date_to': date_to, 'search': search_query,
+        })
+        stats_by_network, all_causes, all_origins = cache.get_or_set(summary_key, archive_summary, 300)
+        
+        # Pagination: slice the narrow union, then load full rows for this page only
+        paginator = UnionPaginator(
+            all_archived, 25,
+            querysets={
+                key: queryset.select_related('archived_by').only(*ARCHIVED_ONLY_FIELDS[key])
+                for key, queryset in archived_querysets.items()
+            },
+            count=sum(stats_by_network.values())
+        )
         page_number = request.GET.get('page', 1)
         
         try:
@@ -824,13 +836,16 @@ def unified_historical_incidents_view(request):
         except (EmptyPage, InvalidPage):
             incidents_page = paginator.page(1)
         
+        for incident in incidents_page.object_list:
+            incident.network_display_name = NETWORKS[incident.network_type_key].name
+        
         context = {
             'incidents': incidents_page,
             'page_obj': incidents_page,
-            'total_archived': len(all_archived),
+            'total_archived': paginator.count,
             'stats_by_network': stats_by_network,
-            'all_causes': sorted(list(all_causes)),
-            'all_origins': sorted(list(all_origins)),
+            'all_causes': all_causes,
+            'all_origins': all_origins,
             'current_filters': {
                 'network_type': network_filter,
                 'cause': cause_filter,
@@ -839,7 +854,7 @@ def unified_historical_incidents_view(request):
                 'date_to': date_to,
                 'search': search_query,
             },
-            'filter_active': any([network_filter, cause_filter, origin_filter, date_from, date_to, search_query]),
+            'filter_active': bool(network_filter or cause_filter or origin_filter or date_from or date_to or search_query),
         }
         
         return render(request, 'incidents/unified_historical.html', context)
@@ -871,20 +886,11 @@ def restore_archived_incident(request, incident_id, network_type):
         return redirect('incidents:unified_historical')
     
     try:
-        # Get the appropriate model
-        model_map = {
-            'transport': TransportNetworkIncident,
-            'file_access': FileAccessNetworkIncident,
-            'radio_access': RadioAccessNetworkIncident,
-            'core': CoreNetworkIncident,
-            'backbone_internet': BackboneInternetNetworkIncident,
-        }
-        
-        if network_type not in model_map:
+        if network_type not in NETWORKS:
             messages.error(request, f"Invalid network type: {network_type}")
             return redirect('incidents:unified_historical')
         
-        model = model_map[network_type]
+        model = NETWORKS[network_type].model
         incident = get_object_or_404(model, id=incident_id)
         
         # Check if incident is archived
@@ -926,22 +932,13 @@ def archive_incident_manual(request, incident_id, network_type):
         }, status=403)
     
     try:
-        # Get the appropriate model
-        model_map = {
-            'transport': TransportNetworkIncident,
-            'file_access': FileAccessNetworkIncident,
-            'radio_access': RadioAccessNetworkIncident,
-            'core': CoreNetworkIncident,
-            'backbone_internet': BackboneInternetNetworkIncident,
-        }
-        
-        if network_type not in model_map:
+        if network_type not in NETWORKS:
             return JsonResponse({
                 'success': False,
                 'error': f'Invalid network type: {network_type}'
             }, status=400)
         
-        model = model_map[network_type]
+        model = NETWORKS[network_type].model
         incident = get_object_or_404(model, id=incident_id)
         
         # Check if incident can be archived
@@ -987,8 +984,7 @@ def bulk_archive_incidents(request):
         }, status=403)
     
     try:
-        import json
-        data = json.loads(request.body)
+        data = orjson.loads(request.body)
         incident_ids = data.get('incident_ids', [])
         network_type = data.get('network_type')
         
@@ -998,44 +994,53 @@ def bulk_archive_incidents(request):
                 'error': 'Missing incident IDs or network type.'
             }, status=400)
         
-        # Get the appropriate model
-        model_map = {
-            'transport': TransportNetworkIncident,
-            'file_access': FileAccessNetworkIncident,
-            'radio_access': RadioAccessNetworkIncident,
-            'core': CoreNetworkIncident,
-            'backbone_internet': BackboneInternetNetworkIncident,
-        }
-        
-        if network_type not in model_map:
+        if network_type not in NETWORKS:
             return JsonResponse({
                 'success': False,
                 'error': f'Invalid network type: {network_type}'
             }, status=400)
         
-        model = model_map[network_type]
+        model = NETWORKS[network_type].model
+        
+        # Admin can bulk archive any resolved incident (bypass 2-hour rule):
+        # one query to find the eligible ones, one UPDATE to archive them
+        eligible_ids = list(model.objects.filter(
+            id__in=incident_ids, date_time_recovery__isnull=False
+        ).values_list('id', flat=True))
+        
+        now = timezone.now()
+        with transaction.atomic():
+            archived_count = model.objects.filter(id__in=eligible_ids).update(
+                is_archived=True,
+                archived_at=now,
+                archived_by=request.user,
+                updated_by=request.user,
+                updated_at=now,
+            )
+            
+            # One audit row per archived incident, inserted in batches
+            ip_address = request.META.get('REMOTE_ADDR')
+            AuditLog.objects.bulk_create([
+                AuditLog(
+                    user=request.user,
+                    action='UPDATE',
+                    model_name=f'{network_type}_incidents',
+                    object_id=str(pk),
+                    changes={'is_archived': True, 'bulk_archive': True},
+                    ip_address=ip_address,
+                )
+                for pk in eligible_ids
+            ], batch_size=500)
         
-        # Archive each incident
-        archived_count = 0
-        failed_incidents = []
+        # QuerySet.update() skips post_save, so refresh the cached statistics here
+        invalidate_network_statistics(network_type)
         
-        for incident_id in incident_ids:
-            try:
-                incident = model.objects.get(id=incident_id)
-                
-                # Admin can bulk archive any resolved incident (bypass 2-hour rule)
-                if incident.date_time_recovery:
-                    success = incident.archive(request.user)
-                    if success:
-                        archived_count += 1
-                    else:
-                        failed_incidents.append(str(incident_id)[:8])
-                else:
-                    # Not resolved yet
-                    failed_incidents.append(str(incident_id)[:8])
-                    
-            except model.DoesNotExist:
-                failed_incidents.append(str(incident_id)[:8])
+        # Missing or unresolved incidents are reported back
+        eligible_hex = {pk.hex for pk in eligible_ids}
+        failed_incidents = [
+            str(incident_id)[:8] for incident_id in incident_ids
+            if str(incident_id).replace('-', '').lower() not in eligible_hex
+        ]
         
         response_data = {
             'success': True,
@@ -1068,8 +1073,6 @@ def save_search_view(request, network_type):
     Save current search filters for quick access later.
     Each user can have multiple saved searches per network type.
     """
-    from .models import SavedSearch
-    
     if network_type not in NETWORKS:
         return JsonResponse({
             'success': False,
@@ -1077,8 +1080,7 @@ def save_search_view(request, network_type):
         }, status=400)
     
     try:
-        import json
-        data = json.loads(request.body)
+        data = orjson.loads(request.body)
         
         search_name = data.get('name', '').strip()
         search_params = data.get('params', {})
@@ -1098,40 +1100,27 @@ def save_search_view(request, network_type):
                 'error': 'Search name must be 100 characters or less'
             }, status=400)
         
-        # Check if user already has a saved search with this name for this network
-        existing = SavedSearch.objects.filter(
-            user=request.user,
-            name=search_name,
-            network_type=network_type
-        ).first()
-        
-        if existing:
-            # Update existing saved search
-            existing.search_params = search_params
-            existing.description = description
-            existing.is_default = set_as_default
-            existing.save()
-            saved_search = existing
-            created = False
-        else:
-            # Create new saved search
-            saved_search = SavedSearch.objects.create(
+        # Create or update this user's search of the same name (unique per network),
+        # and move the default flag to it in the same transaction
+        with transaction.atomic():
+            saved_search, created = SavedSearch.objects.update_or_create(
                 user=request.user,
                 name=search_name,
                 network_type=network_type,
-                search_params=search_params,
-                description=description,
-                is_default=set_as_default
+                defaults={
+                    'search_params': search_params,
+                    'description': description,
+                    'is_default': set_as_default,
+                }
             )
-            created = True
-        
-        # If setting as default, unset other defaults for this network
-        if set_as_default:
-            SavedSearch.objects.filter(
-                user=request.user,
-                network_type=network_type,
-                is_default=True
-            ).exclude(id=saved_search.id).update(is_default=False)
+            
+            # If setting as default, unset other defaults for this network
+            if set_as_default:
+                SavedSearch.objects.filter(
+                    user=request.user,
+                    network_type=network_type,
+                    is_default=True
+                ).exclude(id=saved_search.id).update(is_default=False)
         
         return JsonResponse({
             'success': True,
@@ -1159,8 +1148,6 @@ def list_saved_searches_view(request, network_type):
     Get all saved searches for the current user and network type.
     Returns JSON array of saved searches with metadata.
     """
-    from .models import SavedSearch
-    
     if network_type not in NETWORKS:
         return JsonResponse({
             'success': False,
@@ -1168,24 +1155,29 @@ def list_saved_searches_view(request, network_type):
         }, status=400)
     
     try:
+        # Plain value rows: no SavedSearch instances are built for the listing
         saved_searches = SavedSearch.objects.filter(
             user=request.user,
             network_type=network_type
-        ).order_by('-last_used_at', '-created_at')
-        
-        searches_data = []
-        for search in saved_searches:
-            searches_data.append({
-                'id': str(search.id),
-                'name': search.name,
-                'description': search.description,
-                'params': search.search_params,
-                'params_summary': search.get_params_summary(),
-                'is_default': search.is_default,
-                'use_count': search.use_count,
-                'last_used_at': search.last_used_at.isoformat() if search.last_used_at else None,
-                'created_at': search.created_at.isoformat()
-            })
+        ).order_by('-last_used_at', '-created_at').values(
+            'id', 'name', 'description', 'search_params', 'is_default',
+            'use_count', 'last_used_at', 'created_at'
+        )
+        
+        searches_data = [
+            {
+                'id': str(search['id']),
+                'name': search['name'],
+                'description': search['description'],
+                'params': search['search_params'],
+                'params_summary': summarize_search_params(search['search_params']),
+                'is_default': search['is_default'],
+                'use_count': search['use_count'],
+                'last_used_at': search['last_used_at'].isoformat() if search['last_used_at'] else None,
+                'created_at': search['created_at'].isoformat()
+            }
+            for search in saved_searches
+        ]
         
         return JsonResponse({
             'success': True,
@@ -1207,8 +1199,6 @@ def load_saved_search_view(request, search_id):
     Load a saved search by ID and increment its usage counter.
     Returns the search parameters to populate the search form.
     """
-    from .models import SavedSearch
-    
     try:
         saved_search = get_object_or_404(
             SavedSearch,
@@ -1250,8 +1240,6 @@ def delete_saved_search_view(request, search_id):
     Delete a saved search by ID.
     Only the owner can delete their saved searches.
     """
-    from .models import SavedSearch
-    
     try:
         saved_search = get_object_or_404(
             SavedSearch,
@@ -1286,8 +1274,6 @@ def set_default_search_view(request, search_id):
     Set a saved search as the default for its network type.
     Unsets any other default for that network.
     """
-    from .models import SavedSearch
-    
     try:
         saved_search = get_object_or_404(
             SavedSearch,
@@ -1326,15 +1312,15 @@ def set_default_search_view(request, search_id):
 # CSV/EXCEL EXPORT FUNCTIONALITY (Task 2: Phase 4)
 # ============================================================================
 
-from django.http import HttpResponse
-from .services import get_export_service
+# Relations read by the export field getters (only the creator's username)
+EXPORT_RELATED_FIELDS = ('created_by',)
 
 
 @login_required
 @require_http_methods(["POST"])
 def export_incidents_view(request, network_type):
     """
-    Export filtered incidents to CSV or Excel format.
+    Export filtered incidents to CSV, Excel or Parquet format.
     Respects current search filters and exports only what user sees.
     """
     if network_type not in NETWORKS:
@@ -1344,17 +1330,16 @@ def export_incidents_view(request, network_type):
         }, status=400)
     
     try:
-        import json
-        data = json.loads(request.body)
+        data = orjson.loads(request.body)
         
         export_format = data.get('format', 'csv').lower()
         search_params = data.get('search_params', {})
         
         # Validate format
-        if export_format not in ['csv', 'xlsx', 'excel']:
+        if export_format not in ['csv', 'xlsx', 'excel', 'parquet']:
             return JsonResponse({
                 'success': False,
-                'error': 'Invalid export format. Use "csv" or "xlsx"'
+                'error': 'Invalid export format. Use "csv", "xlsx" or "parquet"'
             }, status=400)
         
         # Normalize excel format
@@ -1362,10 +1347,10 @@ def export_incidents_view(request, network_type):
             export_format = 'xlsx'
         
         # Get the model
-        model = NETWORKS[network_type]['model']
+        model = NETWORKS[network_type].model
         
         # Build queryset with same filters as current view
-        queryset = model.objects.filter(is_archived=False).select_related('created_by', 'updated_by')
+        queryset = model.objects.filter(is_archived=False)
         
         # Apply search filters if provided
         if search_params:
@@ -1374,14 +1359,20 @@ def export_incidents_view(request, network_type):
         else:
             queryset = queryset.order_by('-date_time_incident')
         
+        # Export rows only read created_by; skip the other user join
+        queryset = queryset.select_related(None).select_related(*EXPORT_RELATED_FIELDS)
+        
         # Limit to prevent memory issues (configurable)
         max_export_limit = 10000
-        total_count = queryset.count()
+        
+        # Bounded probe instead of COUNT(*): fetch at most limit + 1 ids; when the
+        # export is within the limit this is also its exact size
+        total_count = len(queryset.values_list('id', flat=True)[:max_export_limit + 1])
         
         if total_count > max_export_limit:
             return JsonResponse({
                 'success': False,
-                'error': f'Export limit exceeded. Maximum {max_export_limit} incidents allowed. Your filter returned {total_count} incidents. Please narrow your search.'
+                'error': f'Export limit exceeded. Maximum {max_export_limit} incidents allowed. Your filter returned more than {max_export_limit} incidents. Please narrow your search.'
             }, status=400)
         
         # Get export service
@@ -1389,8 +1380,11 @@ def export_incidents_view(request, network_type):
         
         # Generate export file
         if export_format == 'csv':
-            content = export_service.export_to_csv()
+            content = export_service.iter_csv()
             content_type = 'text/csv'
+        elif export_format == 'parquet':
+            content = export_service.export_to_parquet()
+            content_type = 'application/vnd.apache.parquet'
         else:  # xlsx
             content = export_service.export_to_excel()
             content_type = 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
@@ -1398,20 +1392,24 @@ def export_incidents_view(request, network_type):
         # Get filename
         filename = export_service.get_filename(export_format)
         
-        # Create response
-        response = HttpResponse(content, content_type=content_type)
-        response['Content-Disposition'] = f'attachment; filename="{filename}"'
+        # Create response; CSV rows stream as they are generated, binary formats
+        # stream straight from their BytesIO buffer
+        if export_format == 'csv':
+            response = StreamingHttpResponse(content, content_type=content_type)
+            response['Content-Disposition'] = f'attachment; filename="{filename}"'
+        else:
+            response = FileResponse(content, as_attachment=True, filename=filename, content_type=content_type)
         
-        # Log export activity (optional)
-        from .models import AuditLog
-        AuditLog.objects.create(
-            user=request.user,
+        # Log export activity (optional), queued once the request's transaction commits
+        transaction.on_commit(partial(
+            queue_audit_log,
+            user_id=request.user.id,
             action='EXPORT',
             model_name=f'{network_type}_incidents',
             object_id=f'{total_count}_records',
             changes={'format': export_format, 'count': total_count},
             ip_address=request.META.get('REMOTE_ADDR'),
-        )
+        ))
         
         return response
         
@@ -1442,27 +1440,26 @@ def bulk_export_all_networks(request):
         }, status=403)
     
     try:
-        import json
-        from openpyxl import Workbook
-        from openpyxl.styles import Font, PatternFill
-        
-        data = json.loads(request.body)
+        data = orjson.loads(request.body)
         date_from = data.get('date_from')
         date_to = data.get('date_to')
         include_archived = data.get('include_archived', False)
         
-        # Create workbook
-        wb = Workbook()
-        wb.remove(wb.active)  # Remove default sheet
+        # Write-only workbook: rows are streamed to the file instead of kept as cell objects
+        wb = Workbook(write_only=True)
+        
+        # Header styling
+        header_font = Font(bold=True, color="FFFFFF")
+        header_fill = PatternFill(start_color="003d7a", end_color="003d7a", fill_type="solid")
         
         total_incidents = 0
         
         # Export each network type to separate sheet
         for network_key, network_config in NETWORKS.items():
-            model = network_config['model']
+            model = network_config.model
             
             # Build queryset
-            queryset = model.objects.select_related('created_by', 'updated_by')
+            queryset = model.objects.select_related(*EXPORT_RELATED_FIELDS)
             
             if not include_archived:
                 queryset = queryset.filter(is_archived=False)
@@ -1479,50 +1476,42 @@ def bulk_export_all_networks(request):
             export_service = get_export_service(queryset, network_key)
             
             # Create sheet
-            sheet_name = network_config['name'][:31]  # Excel limit
+            sheet_name = network_config.name[:31]  # Excel limit
             ws = wb.create_sheet(sheet_name)
             
             # Get headers and data
             headers, field_getters = export_service._get_export_fields()
             
-            # Header styling
-            header_font = Font(bold=True, color="FFFFFF")
-            header_fill = PatternFill(start_color="003d7a", end_color="003d7a", fill_type="solid")
-            
             # Write headers
-            for col_num, header in enumerate(headers, 1):
-                cell = ws.cell(row=1, column=col_num, value=header)
+            header_cells = []
+            for header in headers:
+                cell = WriteOnlyCell(ws, value=header)
                 cell.font = header_font
                 cell.fill = header_fill
+                header_cells.append(cell)
+            ws.append(header_cells)
             
-            # Write data
-            for row_num, incident in enumerate(queryset, 2):
-                for col_num, getter in enumerate(field_getters, 1):
-                    ws.cell(row=row_num, column=col_num, value=getter(incident))
-            
-            total_incidents += queryset.count()
+            # Write data, counting rows as they are written (no extra COUNT query)
+            for incident in queryset.iterator(chunk_size=1000):
+                ws.append([getter(incident) for getter in field_getters])
+                total_incidents += 1
         
-        # Create summary sheet at the beginning
+        # Create summary sheet at the beginning (write-only sheets are filled row by row)
         summary_ws = wb.create_sheet('Summary', 0)
-        summary_ws['A1'] = 'Network Incident Export Summary'
-        summary_ws['A1'].font = Font(bold=True, size=14)
-        
-        summary_ws['A3'] = 'Export Date:'
-        summary_ws['B3'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        
-        summary_ws['A4'] = 'Exported By:'
-        summary_ws['B4'] = request.user.username
+        title_cell = WriteOnlyCell(summary_ws, value='Network Incident Export Summary')
+        title_cell.font = Font(bold=True, size=14)
+        summary_ws.append([title_cell])
+        summary_ws.append([])
         
-        summary_ws['A5'] = 'Total Incidents:'
-        summary_ws['B5'] = total_incidents
+        summary_ws.append(['Export Date:', datetime.now().strftime('%Y-%m-%d %H:%M:%S')])
+        summary_ws.append(['Exported By:', request.user.username])
+        summary_ws.append(['Total Incidents:', total_incidents])
         
         if date_from:
-            summary_ws['A6'] = 'Date From:'
-            summary_ws['B6'] = date_from
+            summary_ws.append(['Date From:', date_from])
         
         if date_to:
-            summary_ws['A7'] = 'Date To:'
-            summary_ws['B7'] = date_to
+            summary_ws.append(['Date To:', date_to])
         
         # Save to BytesIO
         output = io.BytesIO()
@@ -1533,23 +1522,24 @@ def bulk_export_all_networks(request):
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         filename = f'all_networks_export_{timestamp}.xlsx'
         
-        # Create response
-        response = HttpResponse(
-            output.getvalue(),
+        # Create response straight from the buffer
+        response = FileResponse(
+            output,
+            as_attachment=True,
+            filename=filename,
             content_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
         )
-        response['Content-Disposition'] = f'attachment; filename="{filename}"'
         
-        # Log export
-        from .models import AuditLog
-        AuditLog.objects.create(
-            user=request.user,
+        # Log export, queued once the request's transaction commits
+        transaction.on_commit(partial(
+            queue_audit_log,
+            user_id=request.user.id,
             action='EXPORT',
             model_name='all_networks',
             object_id=f'{total_incidents}_records',
             changes={'format': 'xlsx', 'count': total_incidents},
             ip_address=request.META.get('REMOTE_ADDR'),
-        )
+        ))
         
         return response
         